@@ -1,6 +1,5 @@
 import os
 import sys
-import datetime
 import uuid
 from pathlib import Path
 
@@ -39,36 +38,38 @@ def create_test_job():
         "trino_schema": "default",
     }
     
-    # Create the job
-    job = job_manager.create_job(job_id, params)
-    print(f"Test job created with ID: {job_id}")
-    
-    # Mark it as completed with some test data
-    job_manager.update_job_progress(job_id, 100)
-    job_manager.mark_job_completed(
-        job_id, 
-        success=True, 
-        stdout="Test job completed successfully", 
-        returncode=0,
-        error=None
-    )
-    
-    # Update with rows processed and performance metrics
-    performance_metrics = {
-        "total_rows": 1000,
-        "total_batches": 5,
-        "total_processing_time": 2.5,
-        "avg_batch_size": 200.0,
-        "avg_batch_time": 0.5,
-        "processing_rate": 400.0,  # rows per second
-        "batch_sizes": [200, 200, 200, 200, 200],
-        "batch_times": [0.5, 0.48, 0.52, 0.49, 0.51]
-    }
-    
-    job_manager.update_job(job_id, {
-        "rows_processed": 1000,
-        "performance_metrics": performance_metrics
-    })
+    # Create and complete the job in one store transaction
+    with job_manager.batch():
+        # Create the job
+        job = job_manager.create_job(job_id, params)
+        print(f"Test job created with ID: {job_id}")
+        
+        # Mark it as completed with some test data
+        job_manager.update_job_progress(job_id, 100)
+        job_manager.mark_job_completed(
+            job_id, 
+            success=True, 
+            stdout="Test job completed successfully", 
+            returncode=0,
+            error=None
+        )
+        
+        # Update with rows processed and performance metrics
+        performance_metrics = {
+            "total_rows": 1000,
+            "total_batches": 5,
+            "total_processing_time": 2.5,
+            "avg_batch_size": 200.0,
+            "avg_batch_time": 0.5,
+            "processing_rate": 400.0,  # rows per second
+            "batch_sizes": [200, 200, 200, 200, 200],
+            "batch_times": [0.5, 0.48, 0.52, 0.49, 0.51]
+        }
+        
+        job_manager.update_job(job_id, {
+            "rows_processed": 1000,
+            "performance_metrics": performance_metrics
+        })
     
     # Verify that the job was added
     job = job_manager.get_job(job_id)
@@ -3,20 +3,25 @@
 CSV to Iceberg - CLI tool for converting CSV files to Iceberg tables using Trino and Hive metastore.
 """
 import os
+import re
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import click
 from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
 
 # Use the flat structure imports
-from core.schema_inferrer import infer_schema_from_csv
-from connectors.trino_client import TrinoClient
-from connectors.hive_client import HiveMetastoreClient
-from core.iceberg_writer import IcebergWriter
-from utils import setup_logging, validate_csv_file, validate_connection_params
+from utils import setup_logging, validate_csv_file, validate_connection_params, parse_column_list
+
+# catalog.schema.table, each part an unquoted SQL identifier. The parts are
+# interpolated into statements unquoted, so anything else is rejected up front
+_TABLE_NAME_RE = re.compile(r'([A-Za-z_]\w*)\.([A-Za-z_]\w*)\.([A-Za-z_]\w*)', re.ASCII)
+
+# Default Trino user: the login name (USERNAME on Windows, where USER is unset)
+_DEFAULT_USER = os.environ.get('USER') or os.environ.get('USERNAME') or 'admin'
 
 # Initialize console for rich output
 console = Console()
@@ -43,7 +48,7 @@ def cli():
 @click.option('--table-name', '-t', required=True, help='Target Iceberg table name (format: catalog.schema.table)')
 @click.option('--trino-host', required=True, help='Trino host')
 @click.option('--trino-port', default=443, help='Trino port (default: 443)')
-@click.option('--trino-user', default=os.getenv('USER', 'admin'), help='Trino user')
+@click.option('--trino-user', default=_DEFAULT_USER, help='Trino user')
 @click.option('--trino-password', help='Trino password (if authentication is enabled)')
 @click.option('--http-scheme', type=click.Choice(['http', 'https']), default='https', 
               help='HTTP scheme for Trino connection (http or https, default: https)')
@@ -76,6 +81,8 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    # Runs the Trino and Hive metastore handshakes (see below)
+    connect_executor = None
     try:
         # Validate CSV file
         if not validate_csv_file(csv_file, delimiter, quote_char):
@@ -90,9 +97,55 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
         # Parse table name components
         catalog, schema, table = parse_table_name(table_name)
         if not catalog or not schema or not table:
-            console.print("[bold red]Error:[/bold red] Invalid table name format. Use: catalog.schema.table")
+            console.print("[bold red]Error:[/bold red] Invalid table name format. Use: catalog.schema.table (letters, digits and underscores)")
             sys.exit(1)
         
+        # Parse include/exclude columns lists if provided. They also apply to the
+        # data write, so they're needed whether or not a custom schema is given
+        include_cols = parse_column_list(include_columns)
+        exclude_cols = None
+        if include_cols:
+            logger.info(f"Including only these columns: {include_cols}")
+        else:  # Include columns takes precedence
+            exclude_cols = parse_column_list(exclude_columns)
+            if exclude_cols:
+                logger.info(f"Excluding these columns: {exclude_cols}")
+        
+        # Imported only once the arguments have been validated, so --help and
+        # usage errors don't pay for Polars, PyArrow, PyIceberg, Trino and Thrift
+        from core.schema_inferrer import infer_schema_from_csv
+        from connectors.trino_client import TrinoClient
+        from connectors.hive_client import HiveMetastoreClient
+        from core.iceberg_writer import IcebergWriter
+        
+        # The Trino and Hive metastore handshakes (steps 2 and 3) are independent
+        # of each other and of schema inference, so they run in the background:
+        # before inference, which they overlap with, or after a custom schema has
+        # loaded, so an invalid schema file exits without starting them
+        trino_client = TrinoClient(
+            host=trino_host,
+            port=trino_port,
+            user=trino_user,
+            password=trino_password,
+            catalog=trino_catalog,
+            schema=trino_schema,
+            http_scheme=http_scheme,
+            role=trino_role,
+            dry_run=dry_run
+        )
+        connect_executor = ThreadPoolExecutor(max_workers=2)
+        trino_future = None
+        hive_future = None
+        
+        def start_handshakes():
+            nonlocal trino_future, hive_future
+            logger.info(f"Connecting to Trino at {trino_host}:{trino_port}")
+            # The client connects lazily, so open the connection here
+            trino_future = connect_executor.submit(getattr, trino_client, 'connection')
+            if use_hive_metastore:
+                logger.info(f"Connecting to Hive metastore at {hive_metastore_uri}")
+                hive_future = connect_executor.submit(HiveMetastoreClient, hive_metastore_uri)
+        
         # Get schema (either from custom schema file or by inference)
         if custom_schema:
             with console.status("[bold blue]Loading custom schema...[/bold blue]") as status:
@@ -148,20 +201,11 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
                     console.print(f"[bold red]Error:[/bold red] Failed to load custom schema: {str(e)}")
                     sys.exit(1)
             console.print(f"[bold green]✓[/bold green] Custom schema loaded successfully")
+            start_handshakes()
         else:
-            # 1. Infer schema from CSV
-            # Parse include/exclude columns lists if provided
-            include_cols = None
-            exclude_cols = None
+            start_handshakes()
             
-            if include_columns:
-                include_cols = [col.strip() for col in include_columns.split(',')]
-                logger.info(f"Including only these columns: {include_cols}")
-                
-            if exclude_columns and not include_cols:  # Include columns takes precedence
-                exclude_cols = [col.strip() for col in exclude_columns.split(',')]
-                logger.info(f"Excluding these columns: {exclude_cols}")
-                
+            # 1. Infer schema from CSV
             with console.status("[bold blue]Inferring schema from CSV...[/bold blue]") as status:
                 logger.info(f"Inferring schema from CSV file: {csv_file}")
                 iceberg_schema = infer_schema_from_csv(
@@ -176,35 +220,23 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
                 logger.debug(f"Inferred schema: {iceberg_schema}")
             console.print(f"[bold green]✓[/bold green] Schema inferred successfully")
         
-        # 2. Connect to Trino
-        with console.status("[bold blue]Connecting to Trino...[/bold blue]") as status:
-            logger.info(f"Connecting to Trino at {trino_host}:{trino_port}")
-            trino_client = TrinoClient(
-                host=trino_host,
-                port=trino_port,
-                user=trino_user,
-                password=trino_password,
-                catalog=trino_catalog,
-                schema=trino_schema,
-                http_scheme=http_scheme,
-                role=trino_role,
-                dry_run=dry_run
-            )
-        console.print(f"[bold green]✓[/bold green] Connected to Trino")
-        
-        # 3. Connect to Hive metastore (if enabled)
+        # 2. Connect to Trino and 3. the Hive metastore (if enabled). The
+        # handshakes were started with the schema step and are only awaited here
         hive_client = None
-        if use_hive_metastore:
-            with console.status("[bold blue]Connecting to Hive metastore...[/bold blue]") as status:
-                logger.info(f"Connecting to Hive metastore at {hive_metastore_uri}")
+        status_message = "Connecting to Trino and Hive metastore..." if use_hive_metastore else "Connecting to Trino..."
+        with console.status(f"[bold blue]{status_message}[/bold blue]") as status:
+            trino_future.result()
+            console.print(f"[bold green]✓[/bold green] Connected to Trino")
+            
+            if hive_future is not None:
                 try:
-                    hive_client = HiveMetastoreClient(hive_metastore_uri)
+                    hive_client = hive_future.result()
                     console.print(f"[bold green]✓[/bold green] Connected to Hive metastore")
                 except Exception as e:
                     logger.warning(f"Failed to connect to Hive metastore: {str(e)}")
                     console.print(f"[bold yellow]![/bold yellow] Could not connect to Hive metastore: {str(e)}")
                     console.print(f"[bold yellow]![/bold yellow] Continuing without direct Hive metastore connection")
-        else:
+        if not use_hive_metastore:
             logger.info("Hive metastore connection disabled via --no-hive-metastore flag")
             console.print("[bold blue]i[/bold blue] Hive metastore connection disabled, using Trino for all operations")
         
@@ -237,9 +269,18 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
             table=table
         )
         
-        # Simple progress tracking without Rich Progress
+        # Simple progress tracking without Rich Progress. The line is styled as a
+        # whole, so Rich has no markup to parse or numbers to highlight per update.
+        # The writer reports every percent; only every 5% (and completion) is
+        # printed, so a load writes at most ~20 progress lines
+        last_printed = 0
+        
         def progress_update(percent):
-            console.print(f"[bold blue]Writing data: {percent}% complete[/bold blue]")
+            nonlocal last_printed
+            if percent - last_printed < 5 and percent < 100:
+                return
+            last_printed = percent
+            console.print(f"Writing data: {percent}% complete", style="bold blue", markup=False, highlight=False)
             
         if dry_run:
             console.print("[bold blue]Running in DRY RUN mode...[/bold blue]")
@@ -260,15 +301,21 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
         )
         
         if dry_run:
-            console.print("[bold green]✓[/bold green] Dry run completed successfully")
-            console.print("[bold blue]Summary of operations that would be performed:[/bold blue]")
+            # Render the summary in one print rather than one per line
+            summary = [
+                "[bold green]✓[/bold green] Dry run completed successfully",
+                "[bold blue]Summary of operations that would be performed:[/bold blue]"
+            ]
             if hasattr(writer, 'dry_run_results'):
                 stats = writer.dry_run_results.get('stats', {})
-                console.print(f"  - Total rows that would be processed: {stats.get('total_rows', 0)}")
-                console.print(f"  - Number of batches: {stats.get('batches', 0)}")
-                console.print(f"  - Tables that would be created: {stats.get('tables_created', 0)}")
-                console.print(f"  - Tables that would be modified: {stats.get('tables_modified', 0)}")
-                console.print(f"  - Estimated execution time: {stats.get('estimated_execution_time', 0):.2f} seconds")
+                summary.extend([
+                    f"  - Total rows that would be processed: {stats.get('total_rows', 0)}",
+                    f"  - Number of batches: {stats.get('batches', 0)}",
+                    f"  - Tables that would be created: {stats.get('tables_created', 0)}",
+                    f"  - Tables that would be modified: {stats.get('tables_modified', 0)}",
+                    f"  - Estimated execution time: {stats.get('estimated_execution_time', 0):.2f} seconds"
+                ])
+            console.print("\n".join(summary))
             return
         
         console.print(f"[bold green]✓[/bold green] Data written successfully to {table_name}")
@@ -277,13 +324,20 @@ def convert(csv_file: str, delimiter: str, has_header: bool, quote_char: str, ba
         logger.error(f"Error during conversion: {str(e)}", exc_info=True)
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         sys.exit(1)
+    finally:
+        # On an early exit, handshakes that haven't started are cancelled; running
+        # ones end within their connect timeouts (the pool is joined at exit)
+        if connect_executor is not None:
+            connect_executor.shutdown(wait=False, cancel_futures=True)
 
+@lru_cache(maxsize=1024)
 def parse_table_name(table_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Parse a table name in the format catalog.schema.table."""
-    parts = table_name.split('.')
-    if len(parts) != 3:
+    # A single anchored match both splits the name and validates every part
+    match = _TABLE_NAME_RE.fullmatch(table_name)
+    if match is None:
         return None, None, None
-    return parts[0], parts[1], parts[2]
+    return match.groups()
 
 # Export the CLI function as main for easy importing
 main = cli
@@ -2,6 +2,7 @@
 Hive metastore client module for CSV to Iceberg conversion
 """
 import logging
+import re
 import socket
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -15,6 +16,9 @@ from hive_metastore.ttypes import Database, Table, StorageDescriptor, FieldSchem
 
 logger = logging.getLogger(__name__)
 
+# Metastore URI in host or host:port form
+_METASTORE_URI_RE = re.compile(r'([^:]*)(?::(\d+))?')
+
 class HiveMetastoreClient:
     """Client for interacting with Hive metastore"""
     
@@ -32,9 +36,12 @@ class HiveMetastoreClient:
     def _parse_uri(self, uri: str) -> tuple:
         """Parse Hive metastore URI into host and port"""
         try:
-            if ":" not in uri:
-                return uri, 9083  # Default Hive metastore port
-            host, port = uri.split(":")
+            match = _METASTORE_URI_RE.fullmatch(uri)
+            if match is None:
+                raise ValueError("expected host or host:port")
+            host, port = match.groups()
+            if port is None:
+                return host, 9083  # Default Hive metastore port
             return host, int(port)
         except Exception as e:
             logger.error(f"Invalid Hive metastore URI: {uri}. Error: {str(e)}", exc_info=True)
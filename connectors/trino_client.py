@@ -1,9 +1,15 @@
 """
 Trino client module for CSV to Iceberg conversion
 """
+import hashlib
 import logging
+import os
+import re
 import socket
+import threading
 import time
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 import polars as pl
 import pyarrow as pa
 from typing import Dict, List, Any, Optional, Tuple
@@ -27,9 +33,31 @@ from pyiceberg.types import (
 
 # Import Trino client libraries
 import trino
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils import get_env_int
 
 logger = logging.getLogger(__name__)
 
+# Connections shared across TrinoClient instances, keyed on connection settings
+# (with the password hashed, so credentials aren't kept as cache keys). The least
+# recently used connection is closed once more than _CONNECTION_CACHE_SIZE are held
+_connection_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_connection_cache_lock = threading.Lock()
+_CONNECTION_CACHE_SIZE = 8
+
+# Tables known to exist, shared across TrinoClient instances so repeated
+# conversions into one table skip the information_schema lookup. Keyed on
+# (host, port, user, role, catalog, schema, table), since what a client can see
+# depends on who it connects as, with the time the table was last seen; entries
+# expire so tables dropped outside this process are noticed
+_known_tables: Dict[tuple, float] = {}
+_KNOWN_TABLE_TTL = 300  # seconds
+
+# Trino's error for a statement against a table that doesn't exist
+_TABLE_NOT_FOUND_RE = re.compile(r"TABLE_NOT_FOUND|Table '[^']*' does not exist")
+
 class TrinoClient:
     """Client for interacting with Trino server"""
     
@@ -69,20 +97,72 @@ class TrinoClient:
         self.role = role
         self.dry_run = dry_run
         
+        # The role is fixed for the client's lifetime, so build its header once
+        self._role_header = {
+            'x-trino-role': f'system=ROLE{{{role}}}'
+        }
+        
         # Schema cache dict: {(catalog, schema, table): [(column_name, column_type), ...]}
         self._schema_cache = {}
         
         # Table existence cache dict: {(catalog, schema, table): bool}
         self._table_existence_cache = {}
         
-        # Only create a real connection if not in dry run mode
-        if not dry_run:
-            self.connection = self._create_connection()
-        else:
-            self.connection = None
+        # The connection is opened lazily on first use (see the connection property)
+        if dry_run:
             logger.info("Operating in dry run mode - no actual connection to Trino will be made")
         
+    @cached_property
+    def connection(self):
+        """
+        Trino connection, created on first access.
+        
+        Deferring the connection keeps client construction cheap for code paths
+        that never reach the server (dry runs, DDL generation).
+        
+        Returns:
+            Trino DB-API connection, or None in dry run mode
+        """
+        if self.dry_run:
+            return None
+        return self._create_connection()
+        
     def _create_connection(self):
+        """
+        Get a Trino connection for this client's settings.
+        
+        Connections are shared between clients created with the same settings, so
+        repeated conversions against one server skip the availability probe and
+        connection setup.
+        
+        Returns:
+            Trino DB-API connection
+        """
+        password_hash = hashlib.sha256(self.password.encode('utf-8')).hexdigest() if self.password else None
+        key = (self.host, self.port, self.user, password_hash, self.catalog,
+               self.schema, self.http_scheme, self.role)
+        evicted = []
+        with _connection_cache_lock:
+            conn = _connection_cache.get(key)
+            if conn is None:
+                conn = self._open_connection()
+                _connection_cache[key] = conn
+                while len(_connection_cache) > _CONNECTION_CACHE_SIZE:
+                    evicted.append(_connection_cache.popitem(last=False)[1])
+            else:
+                _connection_cache.move_to_end(key)
+                logger.info(f"Reusing Trino connection to {self.host}:{self.port} as user '{self.user}'")
+        
+        # Closing only drops the connection's pooled HTTP connections, so a client
+        # still holding an evicted connection keeps working
+        for old_conn in evicted:
+            try:
+                old_conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing evicted Trino connection: {str(e)}")
+        return conn
+        
+    def _open_connection(self):
         """Create a connection to Trino"""
         try:
             auth_msg = "with authentication" if self.password else "without authentication"
@@ -103,9 +183,7 @@ class TrinoClient:
             auth = None
             
             # Set up HTTP headers with Trino role
-            http_headers = {
-                'x-trino-role': f'system=ROLE{{{self.role}}}'
-            }
+            http_headers = dict(self._role_header)
             logger.info(f"Using Trino role: {self.role}")
             
             conn_args = {
@@ -132,6 +210,11 @@ class TrinoClient:
                     logger.error(error_msg)
                     raise ValueError(error_msg)
             
+            # Every cursor on the connection shares its HTTP session. Size the
+            # session's connection pool for the writer's concurrent INSERTs so
+            # pooled keep-alive connections aren't discarded and re-handshaked
+            conn_args['http_session'] = self._create_http_session()
+            
             # Create connection with appropriate settings            
             conn = trino.dbapi.connect(**conn_args)
             
@@ -142,6 +225,31 @@ class TrinoClient:
             logger.error(f"Failed to connect to Trino: {str(e)}", exc_info=True)
             raise ConnectionError(f"Failed to connect to Trino: {str(e)}")
     
+    def _create_http_session(self) -> requests.Session:
+        """
+        Create the HTTP session for a Trino connection.
+        
+        The pool size comes from the CSV2ICEBERG_HTTP_POOL_SIZE environment variable,
+        defaulting to twice CSV2ICEBERG_UPLOAD_CONCURRENCY (and at least the
+        requests default of 10).
+        
+        Returns:
+            requests Session with a sized connection pool
+        """
+        pool_size = get_env_int('CSV2ICEBERG_HTTP_POOL_SIZE', 0)
+        if pool_size <= 0:
+            pool_size = max(10, 2 * get_env_int('CSV2ICEBERG_UPLOAD_CONCURRENCY', 4))
+        
+        session = requests.Session()
+        # The session replaces the one trino would build, so carry over its
+        # certificate setting (matches 'verify' in the connection arguments)
+        session.verify = False
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        logger.debug("Trino HTTP connection pool size: %d", pool_size)
+        return session
+    
     def execute_query(self, query: str) -> List[Tuple]:
         """
         Execute a query on Trino.
@@ -212,6 +320,13 @@ class TrinoClient:
                 self._table_existence_cache[cache_key] = False
                 return False
             
+            # A table another client recently saw or created still exists
+            seen_at = _known_tables.get(self._known_table_key(catalog, schema, table))
+            if seen_at is not None and time.monotonic() - seen_at < _KNOWN_TABLE_TTL:
+                logger.debug(f"Table {catalog}.{schema}.{table} was recently seen, skipping lookup")
+                self._table_existence_cache[cache_key] = True
+                return True
+            
             if self.connection is None:
                 error_msg = "No active Trino connection"
                 logger.error(error_msg)
@@ -231,6 +346,8 @@ class TrinoClient:
             
             # Cache the result
             self._table_existence_cache[cache_key] = exists
+            if exists:
+                _known_tables[self._known_table_key(catalog, schema, table)] = time.monotonic()
             
             logger.info(f"Table {catalog}.{schema}.{table} {'exists' if exists else 'does not exist'}")
             return exists
@@ -239,6 +356,35 @@ class TrinoClient:
             logger.error(f"Error checking if table exists: {str(e)}")
             raise RuntimeError(f"Failed to check if table exists: {str(e)}")
     
+    def _known_table_key(self, catalog: str, schema: str, table: str) -> tuple:
+        """
+        Key of a table in the process-wide known tables cache.
+        
+        Args:
+            catalog: Catalog name
+            schema: Schema name
+            table: Table name
+            
+        Returns:
+            Tuple identifying the table as seen by this client's user and role
+        """
+        return (self.host, self.port, self.user, self.role, catalog, schema, table)
+    
+    def invalidate_table_cache(self, catalog: str, schema: str, table: str) -> None:
+        """
+        Forget everything cached about a table, so the next lookup asks Trino again.
+        
+        This should be called when a statement reports the table missing although a
+        cache said it exists, such as after it was dropped outside this process.
+        
+        Args:
+            catalog: Catalog name
+            schema: Schema name
+            table: Table name
+        """
+        logger.info(f"Invalidating cached state for table {catalog}.{schema}.{table}")
+        self._clear_cache_for_table(catalog, schema, table)
+    
     def _clear_cache_for_table(self, catalog: str, schema: str, table: str) -> None:
         """
         Clear caches for a specific table.
@@ -259,6 +405,7 @@ class TrinoClient:
         if cache_key in self._table_existence_cache:
             logger.debug(f"Clearing table existence cache for {catalog}.{schema}.{table}")
             del self._table_existence_cache[cache_key]
+        _known_tables.pop(self._known_table_key(catalog, schema, table), None)
     
     def get_create_table_sql(
         self, 
@@ -344,6 +491,7 @@ class TrinoClient:
             
             # Update the cache to indicate the table now exists
             self._table_existence_cache[(catalog, schema, table)] = True
+            _known_tables[self._known_table_key(catalog, schema, table)] = time.monotonic()
             
             logger.info(f"Successfully created table: {catalog}.{schema}.{table}")
         except Exception as e:
@@ -515,22 +663,32 @@ class TrinoClient:
             logger.error(f"Error validating table schema: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to validate table schema: {str(e)}")
 
+def is_table_not_found_error(error: BaseException) -> bool:
+    """
+    Check whether an error (or an error wrapping it) is Trino's "table does not exist".
+    
+    Args:
+        error: Exception raised by a query
+        
+    Returns:
+        True if the query failed because its table doesn't exist
+    """
+    return _TABLE_NOT_FOUND_RE.search(str(error)) is not None
+
+@lru_cache(maxsize=256)
 def iceberg_type_to_trino_type(iceberg_type: Any) -> str:
     """
     Convert a PyIceberg type to a Trino SQL type string.
     
+    PyIceberg types are hashable and compare by value, so results are cached per
+    distinct type; wide schemas repeat a handful of types across their columns.
+    
     Args:
         iceberg_type: PyIceberg type
         
     Returns:
         Trino SQL type string
     """
-    # Import PyIceberg types directly
-    from pyiceberg.types import (
-        BooleanType, IntegerType, LongType, FloatType, DoubleType, 
-        DateType, TimestampType, StringType, DecimalType, StructType
-    )
-    
     # Return SQL types based on the instance type
     if isinstance(iceberg_type, BooleanType):
         return 'BOOLEAN'
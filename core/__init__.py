@@ -1,10 +1,27 @@
 """
 Core modules for CSV to Iceberg conversion
 """
+import importlib
+
 from utils import (
     get_trino_role_header, get_file_size, is_test_job_id,
     format_duration, format_datetime, format_size, format_status,
     clean_column_name
 )
-from core.schema_inferrer import infer_schema_from_csv as infer_schema
-from core.iceberg_writer import IcebergWriter, count_csv_rows
\ No newline at end of file
+
+# Heavy exports (Polars, PyArrow, PyIceberg, Trino) are imported on first access,
+# so importing a light submodule such as core.sql_batcher doesn't pull them in
+_LAZY_EXPORTS = {
+    'infer_schema': ('core.schema_inferrer', 'infer_schema_from_csv'),
+    'IcebergWriter': ('core.iceberg_writer', 'IcebergWriter'),
+    'count_csv_rows': ('core.iceberg_writer', 'count_csv_rows'),
+}
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
@@ -2,19 +2,14 @@
 Core service for CSV to Iceberg conversion operations
 This module centralizes the conversion logic to be used by both CLI and web interfaces
 """
+import io
 import os
-import json
 import logging
 import time
-from typing import Dict, List, Any, Optional, Callable, Tuple, Union
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import traceback
 
-from core.iceberg_writer import IcebergWriter
-from core.schema_inferrer import infer_schema_from_csv
-from connectors.trino_client import TrinoClient
-from connectors.hive_client import HiveMetastoreClient
-from utils import clean_column_name
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -92,7 +87,13 @@ def convert_csv_to_iceberg(
     Returns:
         Dictionary with conversion results and statistics
     """
-    start_time = time.time()
+    # Imported here so the validation helpers in this module don't pull in
+    # Polars, PyArrow, PyIceberg and the Trino/Hive clients
+    from core.iceberg_writer import IcebergWriter
+    from connectors.trino_client import TrinoClient
+    from connectors.hive_client import HiveMetastoreClient
+    
+    start_time = time.perf_counter()
     result = {
         'success': False,
         'table_name': table_name,
@@ -104,13 +105,15 @@ def convert_csv_to_iceberg(
     }
     
     # Create a string buffer for stdout logging
-    stdout_buffer = []
+    stdout_buffer = io.StringIO()
     
-    # Helper function to add log messages
+    # Helper function to add log messages; lines are separated by newlines with
+    # no trailing newline
     def add_log(message):
         logger.info(message)
-        stdout_buffer.append(message)
-        result['stdout'] = '\n'.join(stdout_buffer)
+        if stdout_buffer.tell():
+            stdout_buffer.write('\n')
+        stdout_buffer.write(message)
     
     try:
         # Create Trino client
@@ -215,23 +218,18 @@ def convert_csv_to_iceberg(
             result['dry_run_results'] = writer.dry_run_results
         
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        tb = traceback.format_exc()
         logger.error(f"Error during conversion: {error_msg}", exc_info=True)
         result['success'] = False
         result['error'] = error_msg
-        result['traceback'] = tb
-        
-        # Also log the first few lines of the error to make debugging easier
-        error_lines = tb.split('\n')
-        if len(error_lines) > 5:
-            logger.error(f"Error summary: {error_lines[-5:]}")
+        # The web job runner shows this in the failed job's stderr
+        result['traceback'] = traceback.format_exc()
     finally:
         # Calculate duration
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         result['duration'] = duration
+        result['stdout'] = stdout_buffer.getvalue()
         
     return result
 
@@ -261,6 +259,7 @@ def validate_csv_file(csv_file: str, delimiter: str, quote_char: str) -> bool:
         
     return True
 
+@lru_cache(maxsize=1024)
 def parse_table_name(table_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Parse a table name in the format catalog.schema.table.
@@ -271,15 +270,19 @@ def parse_table_name(table_name: str) -> Tuple[Optional[str], Optional[str], Opt
     Returns:
         Tuple of (catalog, schema, table) components
     """
-    parts = table_name.split('.')
-    if len(parts) == 3:
-        return parts[0], parts[1], parts[2]
-    elif len(parts) == 2:
-        return None, parts[0], parts[1]
-    elif len(parts) == 1:
-        return None, None, parts[0]
-    else:
+    # Peel components off the right with rpartition rather than splitting into a list
+    rest, sep, table = table_name.rpartition('.')
+    if not sep:
+        return None, None, table_name
+    
+    catalog, sep, schema = rest.rpartition('.')
+    if not sep:
+        return None, rest, table
+    
+    # More than three components is not a valid table name
+    if '.' in catalog:
         return None, None, None
+    return catalog, schema, table
 
 def validate_connection_params(
     trino_host: str, 
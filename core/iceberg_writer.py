@@ -3,29 +3,39 @@ Iceberg writer module for CSV to Iceberg conversion using Polars and optimized S
 """
 import os
 import logging
+import threading
 import time
-import csv
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from typing import List, Optional, Callable
 import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, FIRST_EXCEPTION
+from contextlib import contextmanager
 
 # Use Polars for data processing
 import polars as pl
 
-# Import PyIceberg schema
-from pyiceberg.schema import Schema
-
 # Use flat structure imports
-from connectors.trino_client import TrinoClient
+from connectors.trino_client import TrinoClient, is_table_not_found_error
 from core.schema_inferrer import infer_schema_from_df
 from connectors.hive_client import HiveMetastoreClient
 from core.query_collector import QueryCollector
 from core.sql_batcher import SQLBatcher
+from utils import get_env_int
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 class IcebergWriter:
-    """Class for writing data to Iceberg tables"""
+    """
+    Class for writing data to Iceberg tables.
+    
+    Write parallelism is tuned with environment variables, read when the writer
+    and its Trino connection are created:
+    
+    - CSV2ICEBERG_UPLOAD_CONCURRENCY: INSERT statements executing at once (default 4)
+    - CSV2ICEBERG_HTTP_POOL_SIZE: pooled HTTP connections to Trino (default twice
+      the upload concurrency, at least 10)
+    """
     
     def __init__(
         self,
@@ -34,6 +44,7 @@ class IcebergWriter:
         schema: str,
         table: str,
         hive_client: Optional[HiveMetastoreClient] = None,
+        max_in_flight: Optional[int] = None,
     ):
         """
         Initialize Iceberg writer.
@@ -44,12 +55,32 @@ class IcebergWriter:
             catalog: Catalog name
             schema: Schema name
             table: Table name
+            max_in_flight: Maximum number of INSERT statements executing concurrently (1 runs them serially).
+                Defaults to the CSV2ICEBERG_UPLOAD_CONCURRENCY environment variable, or 4
         """
         self.trino_client = trino_client
         self.hive_client = hive_client
         self.catalog = catalog
         self.schema = schema
         self.table = table
+        if max_in_flight is None:
+            max_in_flight = get_env_int('CSV2ICEBERG_UPLOAD_CONCURRENCY', 4)
+        self.max_in_flight = max(1, max_in_flight)
+        
+        # INSERT statements in flight, shared across batches while a load is running
+        self._insert_executor = None
+        self._pending_inserts = deque()
+        
+        # Formatted rows (and their encoded sizes) of a batch's last INSERT, held
+        # back to be packed with the next batch's rows. None outside a CSV load,
+        # where every batch is written completely
+        self._carried_rows = None
+        self._carried_sizes = []
+        self._carried_base_sql = None
+        
+        # Set once a batch has found or created the target table, so later batches
+        # skip the existence check (and, in dry runs, don't collect the DDL again)
+        self._table_ready = False
         
         # Cache for target table schema to avoid repeated queries
         self._cached_target_schema = None
@@ -69,6 +100,112 @@ class IcebergWriter:
         logger.info(f"Invalidating schema cache for {self.catalog}.{self.schema}.{self.table}")
         self._cached_target_schema = None
         self._cached_column_types_dict = None
+    
+    @contextmanager
+    def _insert_window(self):
+        """
+        Open a window of up to max_in_flight concurrently executing INSERT statements.
+        
+        Statements submitted with _submit_insert while the window is open run on a
+        shared thread pool, so a batch's INSERTs keep running while the next batch is
+        read and formatted. Leaving the window waits for every statement. The first
+        failing statement aborts the load: statements that haven't started are
+        cancelled rather than run. Nested windows reuse the outer one.
+        """
+        if self._insert_executor is not None:
+            yield
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            self._insert_executor = executor
+            try:
+                yield
+                self._wait_for_inserts()
+            finally:
+                self._insert_executor = None
+                for future in self._pending_inserts:
+                    future.cancel()
+                self._pending_inserts.clear()
+    
+    def _submit_insert(self, query_sql: str) -> None:
+        """
+        Submit an INSERT statement to the open insert window.
+        
+        Once max_in_flight statements are pending, waits until one of them finishes,
+        so memory held by queued statements stays bounded. A failure of any pending
+        statement, not just the oldest, is raised before more work is submitted.
+        
+        Args:
+            query_sql: SQL statement to execute
+        """
+        self._reap_inserts(block=len(self._pending_inserts) >= self.max_in_flight)
+        self._pending_inserts.append(self._insert_executor.submit(self.trino_client.execute_query, query_sql))
+    
+    def _reap_inserts(self, block: bool = False) -> None:
+        """
+        Drop finished INSERT statements from the pending queue, raising the first failure.
+        
+        Args:
+            block: If True, first wait until at least one pending statement finishes
+        """
+        if block and self._pending_inserts:
+            wait(self._pending_inserts, return_when=FIRST_COMPLETED)
+        still_running = deque()
+        for future in self._pending_inserts:
+            if future.done():
+                future.result()
+            else:
+                still_running.append(future)
+        self._pending_inserts = still_running
+    
+    def _wait_for_inserts(self) -> None:
+        """Wait for every pending INSERT statement, raising as soon as one fails."""
+        if self._pending_inserts:
+            done, _ = wait(self._pending_inserts, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+            self._pending_inserts.clear()
+        
+    def _write_first_batch(self, batch_data, mode: str, dry_run: bool = False, query_collector = None, max_query_size: int = 700000) -> None:
+        """
+        Write the first batch of a load and wait for its INSERTs to finish.
+        
+        Settling the first batch (table creation, overwrite and its INSERTs) keeps
+        later batches' INSERTs from overlapping it. Whether the table exists may come
+        from a cache shared across loads; if the INSERTs fail because the table is
+        gone (e.g. dropped outside this process), the cached state is dropped and the
+        batch is written once more, which checks the table again and creates it.
+        
+        Args:
+            batch_data: First batch of data to write (Polars DataFrame)
+            mode: Write mode (append or overwrite)
+            dry_run: If True, collect queries without executing them
+            query_collector: QueryCollector instance for storing queries in dry run mode
+            max_query_size: Maximum SQL query size in bytes (default: 700000, 70% of Trino's 1MB limit)
+        """
+        try:
+            self._write_batch_to_iceberg(batch_data, mode, dry_run, query_collector, max_query_size)
+            self._wait_for_inserts()
+            return
+        except Exception as e:
+            if dry_run or not is_table_not_found_error(e):
+                raise
+            logger.warning(f"Table {self.catalog}.{self.schema}.{self.table} was not found while writing, checking it again")
+        
+        # Let the failed statements finish and start the batch over
+        for future in self._pending_inserts:
+            future.cancel()
+        wait(self._pending_inserts)
+        self._pending_inserts.clear()
+        if self._carried_rows is not None:
+            self._carried_rows = []
+            self._carried_sizes = []
+        self._table_ready = False
+        self.invalidate_schema_cache()
+        self.trino_client.invalidate_table_cache(self.catalog, self.schema, self.table)
+        
+        self._write_batch_to_iceberg(batch_data, mode, dry_run, query_collector, max_query_size)
+        self._wait_for_inserts()
         
     def write_csv_to_iceberg(
         self,
@@ -100,6 +237,9 @@ class IcebergWriter:
             dry_run: If True, collect and log queries that would be executed without actually running them
             max_query_size: Maximum SQL query size in bytes (default: 700000, 70% of Trino's 1MB limit)
         """
+        # Counts rows for progress reporting (see below)
+        row_counter = None
+        stop_count = threading.Event()
         try:
             # Initialize query collector for dry run mode
             query_collector = None
@@ -107,10 +247,6 @@ class IcebergWriter:
                 query_collector = QueryCollector()
                 logger.info("Running in DRY RUN mode - queries will be collected but not executed")
                 
-            # Get total row count for progress reporting
-            total_rows = count_csv_rows(csv_file, delimiter, quote_char, has_header)
-            logger.info(f"CSV file has {total_rows} rows")
-            
             # Process the CSV in batches
             logger.info(f"Processing CSV file in batch mode (batch size: {batch_size})")
             logger.info(f"Write mode: {mode}")
@@ -121,25 +257,17 @@ class IcebergWriter:
             if exclude_columns:
                 logger.info(f"Excluding these columns: {exclude_columns}")
             
-            # Use Polars lazy reader with enhanced configuration for better memory efficiency and performance
-            lazy_reader = pl.scan_csv(
+            # Read only the leading row to get the column names. The data itself is
+            # streamed batch by batch below, so no full-file reader is built here
+            all_columns = pl.read_csv(
                 csv_file,
                 separator=delimiter,
                 has_header=has_header,
                 quote_char=quote_char,
-                null_values=["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
-                try_parse_dates=True,
-                low_memory=True,
+                n_rows=1,
                 ignore_errors=True,
-                truncate_ragged_lines=True,  # Handle CSV files with inconsistent numbers of fields
-                n_rows=None,  # Process all rows
-                rechunk=True,  # Rechunk for better memory layout
-                row_count_name=None,  # No need for row count column
-                row_count_offset=0
-            )
-            
-            # Get column names - using slice and collect for compatibility with older Polars versions
-            all_columns = lazy_reader.slice(0, 10).collect().columns
+                truncate_ragged_lines=True
+            ).columns
             
             # Apply column filtering
             columns_to_keep = all_columns  # Default to keeping all columns
@@ -147,10 +275,12 @@ class IcebergWriter:
             if has_header and (include_columns or exclude_columns):
                 # Determine which columns to keep
                 if include_columns:
-                    columns_to_keep = [col for col in all_columns if col in include_columns]
+                    include_set = set(include_columns)
+                    columns_to_keep = [col for col in all_columns if col in include_set]
                     logger.info(f"After include filtering: keeping {len(columns_to_keep)} of {len(all_columns)} columns")
                 elif exclude_columns:
-                    columns_to_keep = [col for col in all_columns if col not in exclude_columns]
+                    exclude_set = set(exclude_columns)
+                    columns_to_keep = [col for col in all_columns if col not in exclude_set]
                     logger.info(f"After exclude filtering: keeping {len(columns_to_keep)} of {len(all_columns)} columns")
                 
                 if len(columns_to_keep) == 0:
@@ -158,9 +288,8 @@ class IcebergWriter:
                     logger.error("Column filtering resulted in empty column set - using all columns instead")
                     columns_to_keep = all_columns
                 
-                # Apply column selection to the lazy reader
+                # Log the column selection applied to the batch reader
                 if len(columns_to_keep) < len(all_columns):
-                    lazy_reader = lazy_reader.select(columns_to_keep)
                     logger.info(f"Selected columns: {columns_to_keep}")
             
             # Update column names based on filtering
@@ -175,58 +304,106 @@ class IcebergWriter:
             batch_stats = {
                 "total_batches": 0,
                 "total_processing_time": 0,
-                "batch_sizes": [],
-                "batch_times": [],
-                "start_time": time.time()
+                "start_time": time.perf_counter()
             }
             
-            # Process in batches using streaming approach
-            for batch_start in range(0, total_rows, batch_size):
-                # Define batch bounds
-                batch_end = min(batch_start + batch_size, total_rows)
-                batch_size_actual = batch_end - batch_start
-                
-                # Track batch processing time
-                batch_start_time = time.time()
-                
-                # Get the current batch using Polars lazy evaluation
-                batch = lazy_reader.slice(batch_start, batch_size_actual).collect()
-                
-                # Record batch read time
-                batch_read_time = time.time() - batch_start_time
-                
-                # For first batch in overwrite mode, we need to use a different approach
-                current_mode = mode if not first_batch or mode != 'overwrite' else 'overwrite'
-                if first_batch:
-                    first_batch = False
-                
-                # Write the batch to the Iceberg table directly using Polars DataFrame
-                write_start_time = time.time()
-                self._write_batch_to_iceberg(batch, current_mode, dry_run, query_collector, max_query_size)
-                write_time = time.time() - write_start_time
-                
-                # Calculate total batch processing time
-                batch_total_time = time.time() - batch_start_time
+            # Process in batches using a single streaming pass over the file
+            batches = self._iter_csv_batches(
+                csv_file,
+                batch_size,
+                delimiter=delimiter,
+                has_header=has_header,
+                quote_char=quote_char,
+                columns=columns_to_keep if len(columns_to_keep) < len(all_columns) else None
+            )
+            # Prefetch the next batch on a worker thread so CSV parsing overlaps
+            # with the Trino round trips for the current batch. The insert window
+            # spans all batches, so it doesn't drain at every batch boundary
+            # Count rows for progress reporting on a worker of its own, so batches
+            # are read and written without waiting for a full pass over the file.
+            # Progress is only reported once the count is in. The load doesn't wait
+            # for the worker when it ends: the count is told to stop instead
+            row_counter = ThreadPoolExecutor(max_workers=1)
+            row_count = row_counter.submit(count_csv_rows, csv_file, delimiter, quote_char, has_header, stop_count)
+            total_rows = None
+            with ThreadPoolExecutor(max_workers=2) as prefetcher, self._insert_window():
                 
-                # Update batch statistics
-                batch_stats["total_batches"] += 1
-                batch_stats["batch_sizes"].append(len(batch))
-                batch_stats["batch_times"].append(batch_total_time)
-                batch_stats["total_processing_time"] += batch_total_time
+                # Look up the target table (opening the Trino connection on first use)
+                # while the first batch is read. The result lands in the client's
+                # table existence cache, where the first batch write picks it up
+                table_check = prefetcher.submit(self.trino_client.table_exists, self.catalog, self.schema, self.table)
                 
-                # Log performance metrics for this batch
-                logger.info(f"Batch {batch_stats['total_batches']}: {len(batch)} rows in {batch_total_time:.2f}s " +
-                           f"(Read: {batch_read_time:.2f}s, Write: {write_time:.2f}s)")
+                # Pack each batch's trailing rows into the next batch's INSERTs
+                self._carried_rows = []
                 
-                # Update progress
-                processed_rows += len(batch)
-                current_progress = min(100, int(processed_rows / total_rows * 100))
+                # Read the first batch, then always keep the next one in flight
+                next_batch = prefetcher.submit(next, batches, None)
+                while True:
+                    # Track batch processing time
+                    batch_start_time = time.perf_counter()
+                    
+                    # Wait for the prefetched batch and start reading the one after it
+                    batch = next_batch.result()
+                    if batch is None:
+                        break
+                    next_batch = prefetcher.submit(next, batches, None)
+                    
+                    # Record batch read time
+                    batch_read_time = time.perf_counter() - batch_start_time
+                    
+                    # Take the row count once; it's used for logging and progress below
+                    batch_rows = len(batch)
+                    
+                    # Skip empty slices so they don't cost a table round trip
+                    if batch_rows == 0:
+                        logger.debug("Skipping empty batch at offset %d", processed_rows)
+                        continue
+                    
+                    # Only the first batch overwrites; later batches append to it
+                    current_mode = mode if first_batch else 'append'
+                    if first_batch:
+                        table_check.result()
+                    
+                    # Write the batch to the Iceberg table directly using Polars DataFrame
+                    write_start_time = time.perf_counter()
+                    if first_batch:
+                        self._write_first_batch(batch, current_mode, dry_run, query_collector, max_query_size)
+                        first_batch = False
+                    else:
+                        self._write_batch_to_iceberg(batch, current_mode, dry_run, query_collector, max_query_size)
+                    write_time = time.perf_counter() - write_start_time
+                    
+                    # Calculate total batch processing time
+                    batch_total_time = time.perf_counter() - batch_start_time
+                    
+                    # Update batch statistics
+                    batch_stats["total_batches"] += 1
+                    batch_stats["total_processing_time"] += batch_total_time
+                    
+                    # Log performance metrics for this batch
+                    logger.info("Batch %d: %d rows in %.2fs (Read: %.2fs, Write: %.2fs)",
+                                batch_stats['total_batches'], batch_rows, batch_total_time,
+                                batch_read_time, write_time)
+                    
+                    # Update progress (integer percent; the callback only fires when it changes).
+                    # A batch never waits for the row count; until it finishes, progress
+                    # updates are skipped and the next one catches up
+                    processed_rows += batch_rows
+                    if total_rows is None and row_count.done():
+                        total_rows = row_count.result()
+                        logger.info("CSV file has %d rows", total_rows)
+                    if not total_rows:
+                        continue
+                    current_progress = min(100, processed_rows * 100 // total_rows)
+                    
+                    if current_progress > last_progress:
+                        last_progress = current_progress
+                        if progress_callback:
+                            progress_callback(current_progress)
+                        logger.info("Progress: %d%%", current_progress)
                 
-                if current_progress > last_progress:
-                    last_progress = current_progress
-                    if progress_callback:
-                        progress_callback(current_progress)
-                    logger.info(f"Progress: {current_progress}%")
+                # Write the rows still held back from the last batch
+                self._flush_carried_rows(dry_run, query_collector, max_query_size)
             
             # Final update if needed
             if last_progress < 100 and progress_callback:
@@ -234,9 +411,10 @@ class IcebergWriter:
                 logger.info("Progress: 100%")
             
             # Calculate final performance metrics
-            total_elapsed_time = time.time() - batch_stats["start_time"]
-            avg_batch_size = sum(batch_stats["batch_sizes"]) / batch_stats["total_batches"] if batch_stats["total_batches"] > 0 else 0
-            avg_batch_time = sum(batch_stats["batch_times"]) / batch_stats["total_batches"] if batch_stats["total_batches"] > 0 else 0
+            total_elapsed_time = time.perf_counter() - batch_stats["start_time"]
+            # Averages come from running totals, so no per-batch history is kept
+            avg_batch_size = processed_rows / batch_stats["total_batches"] if batch_stats["total_batches"] > 0 else 0
+            avg_batch_time = batch_stats["total_processing_time"] / batch_stats["total_batches"] if batch_stats["total_batches"] > 0 else 0
             processing_rate = processed_rows / total_elapsed_time if total_elapsed_time > 0 else 0
             
             # Store processing statistics for later access
@@ -246,9 +424,7 @@ class IcebergWriter:
                 "total_processing_time": total_elapsed_time,
                 "avg_batch_size": avg_batch_size,
                 "avg_batch_time": avg_batch_time,
-                "processing_rate": processing_rate,  # rows per second
-                "batch_sizes": batch_stats["batch_sizes"],
-                "batch_times": batch_stats["batch_times"]
+                "processing_rate": processing_rate  # rows per second
             }
             
             # Log performance summary
@@ -275,6 +451,81 @@ class IcebergWriter:
             # This will never be reached because of the raise, but it keeps the type checker happy
             raise RuntimeError(f"Failed to write CSV to Iceberg: {str(e)}")
             return 0  # Will never reach here due to the raise
+        finally:
+            self._carried_rows = None
+            self._carried_sizes = []
+            if row_counter is not None:
+                stop_count.set()
+                row_counter.shutdown(wait=False, cancel_futures=True)
+    
+    def _iter_csv_batches(
+        self,
+        csv_file: str,
+        batch_size: int,
+        delimiter: str = ',',
+        has_header: bool = True,
+        quote_char: str = '"',
+        columns: Optional[List[str]] = None
+    ):
+        """
+        Stream a CSV file as Polars DataFrames of exactly batch_size rows.
+        
+        The file is read once with a batched reader. Slicing a lazy scan per batch
+        would re-parse the file from the start for every batch.
+        
+        Args:
+            csv_file: Path to the CSV file
+            batch_size: Number of rows in each yielded batch (the last may be smaller)
+            delimiter: CSV delimiter character
+            has_header: Whether the CSV has a header row
+            quote_char: CSV quote character
+            columns: Optional list of column names to read (None reads all columns)
+            
+        Returns:
+            Generator of Polars DataFrames
+        """
+        reader = pl.read_csv_batched(
+            csv_file,
+            separator=delimiter,
+            has_header=has_header,
+            quote_char=quote_char,
+            columns=columns,
+            null_values=["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
+            try_parse_dates=True,
+            low_memory=True,
+            ignore_errors=True,
+            truncate_ragged_lines=True,
+            batch_size=batch_size,
+            raise_if_empty=False
+        )
+        
+        # The reader's batch size is only a hint, so re-chunk to exact batch sizes.
+        # Buffered chunks are combined into contiguous memory so each yielded slice
+        # is a view over a single chunk, which makes the row formatting faster
+        pending = []
+        pending_rows = 0
+        while True:
+            chunks = reader.next_batches(1)
+            if not chunks:
+                break
+            for chunk in chunks:
+                pending.append(chunk)
+                pending_rows += len(chunk)
+            
+            if pending_rows >= batch_size:
+                buffered = pl.concat(pending, how='vertical_relaxed', rechunk=True)
+                pending = []
+                pending_rows = 0
+                # Full slices go out; a short trailing slice is carried into the next batch
+                for piece in buffered.iter_slices(batch_size):
+                    if len(piece) == batch_size:
+                        yield piece
+                    else:
+                        pending = [piece]
+                        pending_rows = len(piece)
+        
+        if pending_rows > 0:
+            yield pl.concat(pending, how='vertical_relaxed', rechunk=True)
     
     def _write_batch_to_iceberg(self, batch_data, mode: str, dry_run: bool = False, query_collector = None, max_query_size: int = 700000) -> None:
         """
@@ -287,10 +538,10 @@ class IcebergWriter:
             query_collector: QueryCollector instance for storing queries in dry run mode
             max_query_size: Maximum SQL query size in bytes (default: 700000, 70% of Trino's 1MB limit)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             batch_size = len(batch_data) if hasattr(batch_data, '__len__') else 'unknown'
-            logger.info(f"Writing batch of {batch_size} rows to {self.catalog}.{self.schema}.{self.table} in {mode} mode")
+            logger.debug("Writing batch of %s rows to %s.%s.%s in %s mode", batch_size, self.catalog, self.schema, self.table, mode)
         except Exception as e:
             # This should never happen but makes logging more robust
             logger.warning(f"Could not determine batch size: {str(e)}")
@@ -320,18 +571,14 @@ class IcebergWriter:
             from utils import clean_column_name
             
             # Clean column names for SQL compatibility
-            cleaned_columns = []
-            for col in columns:
-                # Apply consistent column name cleaning
-                clean_col = clean_column_name(col)
-                cleaned_columns.append(clean_col)
+            cleaned_columns = [clean_column_name(col) for col in columns]
             
             # Update the batch DataFrame with cleaned column names if needed
             if any(orig != cleaned for orig, cleaned in zip(columns, cleaned_columns)):
                 # Create a mapping from original to cleaned column names
                 column_mapping = {orig: cleaned for orig, cleaned in zip(columns, cleaned_columns)}
                 batch_data = batch_data.rename(column_mapping)
-                logger.debug(f"Renamed DataFrame columns for SQL compatibility: {column_mapping}")
+                logger.debug("Renamed DataFrame columns for SQL compatibility: %s", column_mapping)
                 
             # Update column references
             columns = cleaned_columns
@@ -339,8 +586,8 @@ class IcebergWriter:
             column_names_str = ", ".join(quoted_columns)
             
             # Check if table exists for both append and overwrite modes
-            table_exists = self.trino_client.table_exists(self.catalog, self.schema, self.table)
-            logger.info(f"Table {self.catalog}.{self.schema}.{self.table} exists: {table_exists}")
+            table_exists = self._table_ready or self.trino_client.table_exists(self.catalog, self.schema, self.table)
+            logger.debug("Table %s.%s.%s exists: %s", self.catalog, self.schema, self.table, table_exists)
             
             # Special handling for overwrite mode when table exists
             if table_exists and mode == 'overwrite' and len(batch_data) > 0:
@@ -351,7 +598,7 @@ class IcebergWriter:
                     if dry_run and query_collector:
                         # In dry run mode, just collect the query
                         query_collector.add_query(truncate_sql, "DDL", 0, f"{self.catalog}.{self.schema}.{self.table}")
-                        logger.debug(f"[DRY RUN] Would execute: {truncate_sql}")
+                        logger.debug("[DRY RUN] Would execute: %s", truncate_sql)
                     else:
                         # Normal execution
                         self.trino_client.execute_query(truncate_sql)
@@ -381,7 +628,7 @@ class IcebergWriter:
                     )
                     query_collector.add_query(create_table_sql, "DDL", 0, f"{self.catalog}.{self.schema}.{self.table}")
                     logger.info(f"[DRY RUN] Would create table: {self.catalog}.{self.schema}.{self.table}")
-                    logger.debug(f"[DRY RUN] Would execute: {create_table_sql}")
+                    logger.debug("[DRY RUN] Would execute: %s", create_table_sql)
                 else:
                     # Normal execution
                     self.trino_client.create_iceberg_table(self.catalog, self.schema, self.table, iceberg_schema)
@@ -390,9 +637,10 @@ class IcebergWriter:
                 # Set empty schema to force dynamic inference for the first batch
                 self._cached_target_schema = []
                 self._cached_column_types_dict = {}
+            self._table_ready = True
             
             # Use optimized SQL INSERT method
-            logger.info("Using optimized SQL INSERT method for data loading")
+            logger.debug("Using optimized SQL INSERT method for data loading")
             
             # Get the target table schema for improved data type handling
             try:
@@ -404,26 +652,26 @@ class IcebergWriter:
                     # Create dictionary only if we got valid schema results
                     if self._cached_target_schema is not None and len(self._cached_target_schema) > 0:
                         self._cached_column_types_dict = {col_name: col_type for col_name, col_type in self._cached_target_schema}
-                        logger.debug(f"Cached schema with types: {self._cached_column_types_dict}")
+                        logger.debug("Cached schema with types: %s", self._cached_column_types_dict)
                     else:
                         # If schema retrieval returned empty result, initialize empty dict
                         self._cached_column_types_dict = {}
                         logger.warning(f"Retrieved empty schema for {self.catalog}.{self.schema}.{self.table}")
                 else:
-                    logger.debug(f"Using cached schema for {self.catalog}.{self.schema}.{self.table}")
+                    logger.debug("Using cached schema for %s.%s.%s", self.catalog, self.schema, self.table)
             except Exception as e:
                 logger.warning(f"Failed to retrieve schema: {str(e)}")
                 self._cached_column_types_dict = {}
             
             # Process in optimized batches
-            self._write_batch_to_iceberg_sql(batch_data, mode, dry_run, query_collector, max_query_size)
+            self._write_batch_to_iceberg_sql(batch_data, mode, dry_run, query_collector, max_query_size, column_names_str)
             
             # Log execution time for this batch
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             if dry_run:
-                logger.info(f"SQL INSERT batch processing (dry run) completed in {elapsed_time:.2f} seconds")
+                logger.debug("SQL INSERT batch processing (dry run) completed in %.2f seconds", elapsed_time)
             else:
-                logger.info(f"SQL INSERT batch processing completed in {elapsed_time:.2f} seconds")
+                logger.debug("SQL INSERT batch processing completed in %.2f seconds", elapsed_time)
             
         except Exception as e:
             logger.error(f"Error in _write_batch_to_iceberg: {str(e)}", exc_info=True)
@@ -435,7 +683,7 @@ class IcebergWriter:
             
             raise RuntimeError(f"Failed to write batch to Iceberg: {str(e)}")
             
-    def _write_batch_to_iceberg_sql(self, batch_data, mode: str, dry_run: bool = False, query_collector = None, max_query_size: int = 700000) -> None:
+    def _write_batch_to_iceberg_sql(self, batch_data, mode: str, dry_run: bool = False, query_collector = None, max_query_size: int = 700000, column_names_str: Optional[str] = None) -> None:
         """
         High-performance method to write batch data using optimized SQL INSERT statements with SQLBatcher.
         
@@ -445,127 +693,205 @@ class IcebergWriter:
             dry_run: If True, collect queries without executing them
             query_collector: QueryCollector instance for storing queries in dry run mode
             max_query_size: Maximum SQL query size in bytes (default: 700000, 70% of Trino's 1MB limit)
+            column_names_str: Pre-built quoted column list for the INSERT (built from batch_data if None)
         """
-        logger.info(f"Using optimized SQL INSERT method with SQLBatcher for batch of {len(batch_data)} rows")
+        num_rows = len(batch_data)
+        if num_rows == 0:
+            logger.debug("Skipping empty insert")
+            return
+        
+        logger.debug("Using optimized SQL INSERT method with SQLBatcher for batch of %d rows", num_rows)
         
         try:
             # Get column names from the dataframe
             columns = batch_data.columns
-            quoted_columns = [f'"{col}"' for col in columns]
-            column_names_str = ", ".join(quoted_columns)
-            
-            # Define maximum SQL query size (in characters) - Trino has a limit of 1,000,000
-            # Use the passed max_query_size parameter instead of hardcoded value
-            MAX_QUERY_LENGTH = max_query_size  # Default is 700KB (70% of Trino's limit)
-            
-            # Initialize row processing counter
-            rows_processed = 0
+            if column_names_str is None:
+                quoted_columns = [f'"{col}"' for col in columns]
+                column_names_str = ", ".join(quoted_columns)
             
             # Base SQL part
             base_sql = f"INSERT INTO {self.catalog}.{self.schema}.{self.table} ({column_names_str}) VALUES "
             
-            # Create a SQL batcher instance with a safer limit
-            sql_batcher = SQLBatcher(max_bytes=MAX_QUERY_LENGTH, dry_run=dry_run)
-            
-            # Define a callback function for the SQL batcher to execute queries
-            def execute_callback(query_sql):
-                self.trino_client.execute_query(query_sql)
-            
-            # Format all rows in the batch using a simpler approach with SQLBatcher
+            # Format all rows in the batch using a simpler approach with SQLBatcher.
+            # The encoded size of each row is measured while formatting so the
+            # statement packing below doesn't need a second pass over the rows.
             formatted_rows = []
-            for row in batch_data.rows(named=True):
+            row_sizes = []
+            # The loop below runs once per value, so the types and bound append
+            # methods it uses are looked up once here rather than on every pass
+            datetime_type = datetime.datetime
+            date_type = datetime.date
+            add_row = formatted_rows.append
+            add_size = row_sizes.append
+            # Rows are iterated as plain tuples in column order; building a dict per
+            # row just to look each value up again by name is wasted work
+            for row in batch_data.iter_rows():
                 # Format row values
                 row_values = []
+                add_value = row_values.append
                 
-                for col in columns:
-                    val = row[col]
+                for val in row:
                     if val is None:
-                        row_values.append("NULL")
+                        add_value("NULL")
                     elif isinstance(val, bool):
-                        row_values.append("TRUE" if val else "FALSE")
+                        add_value("TRUE" if val else "FALSE")
                     elif isinstance(val, (int, float)):
-                        row_values.append(str(val))
-                    elif isinstance(val, datetime.datetime):
+                        add_value(str(val))
+                    elif isinstance(val, datetime_type):
                         # Format timestamp properly for Trino
-                        row_values.append(f"TIMESTAMP '{val}'")
-                    elif isinstance(val, datetime.date):
-                        row_values.append(f"DATE '{val}'")
+                        add_value(f"TIMESTAMP '{val}'")
+                    elif isinstance(val, date_type):
+                        add_value(f"DATE '{val}'")
                     else:
                         # Handle string values with proper escaping
                         str_val = str(val).replace("'", "''")
-                        row_values.append(f"'{str_val}'")
+                        add_value(f"'{str_val}'")
                 
-                formatted_rows.append(f"({', '.join(row_values)})")
-            
-            # Prepare SQL INSERT statements with a reduced max size
-            # Calculate average row size to determine batch size
-            MAX_ROWS_PER_INSERT = 500  # Start with a safe limit
-            
-            if formatted_rows:
-                # Calculate average row size
-                avg_row_size = sum(len(row.encode('utf-8')) for row in formatted_rows) / len(formatted_rows)
-                # Use the provided max_query_size
-                max_safe_query_size = max_query_size
-                # Base SQL part size 
-                base_sql_size = len(base_sql.encode('utf-8'))
-                # Calculate how many rows we can safely fit
-                max_safe_rows = int((max_safe_query_size - base_sql_size) / (avg_row_size + 2))  # +2 for comma and space
-                # Use the smaller of our calculated value or default
-                batch_size = min(max_safe_rows, MAX_ROWS_PER_INSERT)
-                batch_size = max(batch_size, 1)  # Ensure at least 1 row per batch
-                
-                logger.info(f"Calculated batch size: {batch_size} rows per INSERT (avg row size: {avg_row_size:.0f} bytes)")
-            else:
-                batch_size = MAX_ROWS_PER_INSERT
+                formatted_row = f"({', '.join(row_values)})"
+                add_row(formatted_row)
+                add_size(len(formatted_row.encode('utf-8')))
+            
+            # Rows held back from the previous batch's last statement go first
+            if self._carried_rows and self._carried_base_sql == base_sql:
+                formatted_rows = self._carried_rows + formatted_rows
+                row_sizes = self._carried_sizes + row_sizes
+            elif self._carried_rows:
+                self._flush_carried_rows(dry_run, query_collector, max_query_size)
+            
+            # Pack rows into INSERT statements by their measured size rather than a
+            # row count estimated from the average row width, so statements with
+            # uneven rows still fill up to max_query_size without overshooting it.
+            # Every INSERT commits its own Iceberg snapshot, so there is no separate
+            # row cap: fewer, fuller statements mean fewer snapshots per load.
+            base_sql_size = len(base_sql.encode('utf-8'))
             
-            # Create multiple INSERT statements with smaller row batches
             insert_statements = []
-            for i in range(0, len(formatted_rows), batch_size):
-                batch = formatted_rows[i:i + batch_size]
-                values_sql = ", ".join(batch)
-                insert_sql = f"{base_sql}{values_sql}"
-                insert_statements.append(insert_sql)
-            
-            # Define metadata for the query collector
-            metadata = {
-                "type": "DML",
-                "row_count": len(formatted_rows),
-                "table_name": f"{self.catalog}.{self.schema}.{self.table}"
-            }
+            statement_rows = []
+            statement_size = base_sql_size
+            for formatted_row, row_size in zip(formatted_rows, row_sizes):
+                # +2 for the comma and space between rows
+                if statement_rows and statement_size + row_size + 2 > max_query_size:
+                    insert_statements.append(f"{base_sql}{', '.join(statement_rows)}")
+                    statement_rows = []
+                    statement_size = base_sql_size
+                statement_rows.append(formatted_row)
+                statement_size += row_size + 2
+            
+            held_rows = []
+            if statement_rows:
+                if self._carried_rows is not None:
+                    # Within a load, hold the last, partly filled statement back so
+                    # the next batch's rows can fill it up instead of committing an
+                    # undersized snapshot at every batch boundary
+                    held_rows = statement_rows
+                    self._carried_rows = statement_rows
+                    self._carried_sizes = row_sizes[len(row_sizes) - len(statement_rows):]
+                    self._carried_base_sql = base_sql
+                else:
+                    insert_statements.append(f"{base_sql}{', '.join(statement_rows)}")
             
-            # Process all statements using the SQLBatcher for optimal batching
-            rows_processed = 0
-            if dry_run and query_collector:
-                # In dry run mode
-                rows_processed = sql_batcher.process_statements(
-                    insert_statements,
-                    execute_callback,
-                    query_collector,
-                    metadata
-                )
-                logger.info(f"[DRY RUN] Would insert {len(batch_data)} rows to {self.catalog}.{self.schema}.{self.table}")
-            else:
-                # Normal execution
-                try:
-                    rows_processed = sql_batcher.process_statements(
-                        insert_statements, 
-                        execute_callback
-                    )
-                    logger.info(f"Successfully inserted {rows_processed} rows to {self.catalog}.{self.schema}.{self.table} using SQL batcher")
-                except Exception as e:
-                    logger.error(f"Error during SQL INSERT: {str(e)}", exc_info=True)
-                    raise RuntimeError(f"Failed to write data to Iceberg table: {str(e)}")
+            if formatted_rows and logger.isEnabledFor(logging.DEBUG):
+                avg_row_size = sum(row_sizes) / len(row_sizes)
+                logger.debug("Packed %d rows into %d INSERT statements (avg row size: %.0f bytes)",
+                             len(formatted_rows), len(insert_statements), avg_row_size)
+            
+            rows_processed = self._execute_insert_statements(
+                insert_statements, len(formatted_rows) - len(held_rows), dry_run, query_collector, max_query_size
+            )
             
-            logger.info(f"Successfully processed {rows_processed} rows using SQLBatcher")
+            logger.debug("Successfully processed %d rows using SQLBatcher", rows_processed)
         except Exception as e:
             logger.error(f"Error in SQL INSERT method: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to write data using SQL INSERT: {str(e)}")
+    
+    def _execute_insert_statements(self, insert_statements: List[str], row_count: int, dry_run: bool = False, query_collector = None, max_query_size: int = 700000) -> int:
+        """
+        Run packed INSERT statements through the SQLBatcher, or collect them in dry run mode.
+        
+        Args:
+            insert_statements: INSERT statements to run
+            row_count: Number of rows in the statements (recorded by the query collector)
+            dry_run: If True, collect queries without executing them
+            query_collector: QueryCollector instance for storing queries in dry run mode
+            max_query_size: Maximum SQL query size in bytes (default: 700000, 70% of Trino's 1MB limit)
+            
+        Returns:
+            Number of statements processed
+        """
+        if not insert_statements:
+            return 0
+        
+        # Define maximum SQL query size (in characters) - Trino has a limit of 1,000,000
+        # Use the passed max_query_size parameter instead of hardcoded value
+        MAX_QUERY_LENGTH = max_query_size  # Default is 700KB (70% of Trino's limit)
+        
+        # Create a SQL batcher instance with a safer limit
+        # Trino runs a single statement per query, so each INSERT is sent on its own
+        sql_batcher = SQLBatcher(max_bytes=MAX_QUERY_LENGTH, dry_run=dry_run, strategy='per_statement')
+        
+        # Define a callback function for the SQL batcher to execute queries
+        def execute_callback(query_sql):
+            self.trino_client.execute_query(query_sql)
+        
+        # Define metadata for the query collector
+        metadata = {
+            "type": "DML",
+            "row_count": row_count,
+            "table_name": f"{self.catalog}.{self.schema}.{self.table}"
+        }
+        
+        # Process all statements using the SQLBatcher for optimal batching
+        rows_processed = 0
+        if dry_run and query_collector:
+            # In dry run mode
+            rows_processed = sql_batcher.process_statements(
+                insert_statements,
+                execute_callback,
+                query_collector,
+                metadata
+            )
+            logger.debug("[DRY RUN] Would insert %d rows to %s.%s.%s", row_count, self.catalog, self.schema, self.table)
+        else:
+            # Normal execution. Each INSERT is an independent Trino query and
+            # Iceberg commit, so up to max_in_flight of them run concurrently.
+            # Within a load's window the statements may still be running when
+            # this returns; they are awaited when the window closes
+            try:
+                with self._insert_window():
+                    rows_processed = sql_batcher.process_statements(
+                        insert_statements, 
+                        self._submit_insert
+                    )
+                logger.debug("Submitted %d rows to %s.%s.%s using SQL batcher", row_count, self.catalog, self.schema, self.table)
+            except Exception as e:
+                logger.error(f"Error during SQL INSERT: {str(e)}", exc_info=True)
+                raise RuntimeError(f"Failed to write data to Iceberg table: {str(e)}")
+        return rows_processed
+    
+    def _flush_carried_rows(self, dry_run: bool = False, query_collector = None, max_query_size: int = 700000) -> None:
+        """
+        Write the rows held back from the last batch's final INSERT statement.
+        
+        Args:
+            dry_run: If True, collect queries without executing them
+            query_collector: QueryCollector instance for storing queries in dry run mode
+            max_query_size: Maximum SQL query size in bytes (default: 700000, 70% of Trino's 1MB limit)
+        """
+        rows = self._carried_rows
+        if not rows:
+            return
+        self._carried_rows = []
+        self._carried_sizes = []
+        self._execute_insert_statements(
+            [f"{self._carried_base_sql}{', '.join(rows)}"], len(rows), dry_run, query_collector, max_query_size
+        )
 
 def count_csv_rows(
     csv_file: str, 
     delimiter: str = ',', 
     quote_char: str = '"',
-    has_header: bool = True
+    has_header: bool = True,
+    stop_event: Optional[threading.Event] = None
 ) -> int:
     """
     Count the number of rows in a CSV file using optimized methods.
@@ -575,6 +901,8 @@ def count_csv_rows(
         delimiter: CSV delimiter character
         quote_char: CSV quote character
         has_header: Whether the CSV has a header row
+        stop_event: Optional event that abandons the count once set. Large files
+            are checked between blocks, and the rows counted so far are returned
         
     Returns:
         Number of rows in the CSV file
@@ -604,10 +932,21 @@ def count_csv_rows(
         # For larger files, use a line-based approach for better performance
         logger.info(f"Using optimized row counting for large file ({file_size/1024/1024:.1f} MB)")
         
-        # Open the file in binary mode for better performance
+        # Count newlines over fixed-size binary blocks. bytes.count runs in C and
+        # memory stays bounded, unlike materializing every line with readlines()
+        line_count = 0
+        last_block = b''
         with open(csv_file, 'rb') as f:
-            # Count newlines
-            line_count = sum(1 for _ in f.readlines())
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                line_count += block.count(b'\n')
+                last_block = block
+                if stop_event is not None and stop_event.is_set():
+                    logger.debug("Row count stopped after %d lines", line_count)
+                    break
+        
+        # A final line without a trailing newline still counts as a line
+        if last_block and not last_block.endswith(b'\n'):
+            line_count += 1
             
         # Adjust for header if needed
         row_count = line_count - 1 if has_header else line_count
@@ -1,11 +1,52 @@
 """
 Query collector module for dry run mode in CSV to Iceberg conversion
 """
+import sys
 import logging
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Any, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Leading keywords used to classify DDL statements. Only the head of a statement
+# is upper-cased, so classification doesn't copy the whole query string
+_CREATE_PREFIXES = ("CREATE TABLE",)
+_MODIFY_PREFIXES = ("ALTER TABLE", "TRUNCATE TABLE", "DELETE FROM")
+_HEAD_LENGTH = 32
+
+@dataclass(slots=True)
+class DDLRecord:
+    """A collected DDL statement"""
+    query: str
+    table_name: Optional[str]
+
+@dataclass(slots=True)
+class DMLRecord:
+    """
+    A collected DML statement and the number of rows it would write.
+    
+    The statement is stored split before its VALUES clause. The prefix
+    (INSERT INTO ... (columns)) is interned, so every statement for the same
+    table and columns shares one copy of it.
+    """
+    prefix: str
+    values: str
+    row_count: int
+    table_name: Optional[str]
+    
+    @classmethod
+    def from_query(cls, query: str, row_count: int, table_name: Optional[str]) -> "DMLRecord":
+        """Split a statement before its VALUES clause and intern the prefix"""
+        idx = query.find(" VALUES ")
+        if idx > 0:
+            return cls(sys.intern(query[:idx]), query[idx:], row_count, table_name)
+        return cls(query, "", row_count, table_name)
+    
+    @property
+    def query(self) -> str:
+        """The full SQL statement"""
+        return self.prefix + self.values
+
 class QueryCollector:
     """
     Collects queries during dry run mode instead of executing them.
@@ -16,8 +57,9 @@ class QueryCollector:
     
     def __init__(self):
         """Initialize a new query collector"""
-        self.queries: List[Dict[str, Any]] = []
-        self.ddl_statements: List[Dict[str, Any]] = []
+        # Slotted records rather than dicts keep large dry runs small in memory
+        self.queries: List[DMLRecord] = []
+        self.ddl_statements: List[DDLRecord] = []
         # Use Dict[str, Union[int, float]] to allow mixed types
         self.stats: Dict[str, Union[int, float]] = {
             "total_rows": 0,
@@ -38,22 +80,16 @@ class QueryCollector:
             table_name: Name of the table being affected
         """
         if query_type.upper() == "DDL":
-            self.ddl_statements.append({
-                "query": query,
-                "table_name": table_name
-            })
+            self.ddl_statements.append(DDLRecord(query, table_name))
             
             # Track table creation
-            if "CREATE TABLE" in query.upper():
+            head = query.lstrip()[:_HEAD_LENGTH].upper()
+            if head.startswith(_CREATE_PREFIXES):
                 self.stats["tables_created"] += 1
-            elif "ALTER TABLE" in query.upper() or "TRUNCATE TABLE" in query.upper() or "DELETE FROM" in query.upper():
+            elif head.startswith(_MODIFY_PREFIXES):
                 self.stats["tables_modified"] += 1
         else:
-            self.queries.append({
-                "query": query,
-                "row_count": row_count,
-                "table_name": table_name
-            })
+            self.queries.append(DMLRecord.from_query(query, row_count, table_name))
             self.stats["total_rows"] += row_count
             self.stats["batches"] += 1
             
@@ -73,8 +109,8 @@ class QueryCollector:
             "dml_count": len(self.queries),
             "stats": self.stats,
             "sample_queries": {
-                "ddl": self.ddl_statements[0]["query"] if self.ddl_statements else None,
-                "dml": self.queries[0]["query"] if self.queries else None
+                "ddl": self.ddl_statements[0].query if self.ddl_statements else None,
+                "dml": self.queries[0].query if self.queries else None
             }
         }
     
@@ -83,11 +119,14 @@ class QueryCollector:
         Get a full report of all collected queries
         
         Returns:
-            Dictionary with the complete data
+            Dictionary with the complete data (statements as plain dictionaries)
         """
         return {
-            "ddl_statements": self.ddl_statements,
-            "dml_queries": self.queries,
+            "ddl_statements": [asdict(record) for record in self.ddl_statements],
+            "dml_queries": [
+                {"query": record.query, "row_count": record.row_count, "table_name": record.table_name}
+                for record in self.queries
+            ],
             "stats": self.stats
         }
     
@@ -104,7 +143,7 @@ class QueryCollector:
         # Sample DDL
         if self.ddl_statements:
             logger.info("Sample DDL:")
-            sample_ddl = self.ddl_statements[0]["query"]
+            sample_ddl = self.ddl_statements[0].query
             # Truncate if too long
             if len(sample_ddl) > 200:
                 sample_ddl = sample_ddl[:200] + "..."
@@ -113,7 +152,7 @@ class QueryCollector:
         # Sample DML
         if self.queries:
             logger.info("Sample DML:")
-            sample_dml = self.queries[0]["query"]
+            sample_dml = self.queries[0].query
             # Truncate if too long
             if len(sample_dml) > 200:
                 sample_dml = sample_dml[:200] + "..."
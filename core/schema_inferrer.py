@@ -53,6 +53,52 @@ def clean_column_name(col_name: str) -> str:
     
     return clean_name
 
+def read_csv_sample(
+    csv_file: str,
+    delimiter: str = ',',
+    has_header: bool = True,
+    quote_char: str = '"',
+    sample_size: Optional[int] = 1000,
+    columns: Optional[List[str]] = None
+) -> pl.DataFrame:
+    """
+    Read the leading rows of a CSV file with the options used for schema inference.
+    
+    The result can be passed to infer_schema_from_csv and analyze_column_cardinality
+    so that both work from one parse of the sample.
+    
+    Args:
+        csv_file: Path to the CSV file
+        delimiter: CSV delimiter character
+        has_header: Whether the CSV has a header row
+        quote_char: CSV quote character
+        sample_size: Number of rows to read (None reads the whole file)
+        columns: Optional list of column names to read (None reads all columns)
+        
+    Returns:
+        Polars DataFrame with the sampled rows
+    """
+    read_args = {
+        "separator": delimiter,
+        "has_header": has_header,
+        "quote_char": quote_char,
+        "null_values": ["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
+        "try_parse_dates": True,  # Try to parse date/datetime columns
+        "low_memory": True,
+        "ignore_errors": True,  # Skip rows with parsing errors
+        "truncate_ragged_lines": True  # Handle CSV files with inconsistent numbers of fields
+    }
+    
+    # Add n_rows and infer_schema_length only if sample_size is specified
+    if sample_size is not None:
+        read_args["n_rows"] = sample_size
+        read_args["infer_schema_length"] = sample_size
+    
+    if columns:
+        read_args["columns"] = columns
+    
+    return pl.read_csv(csv_file, **read_args)
+
 def infer_schema_from_csv(
     csv_file: str, 
     delimiter: str = ',', 
@@ -60,7 +106,8 @@ def infer_schema_from_csv(
     quote_char: str = '"',
     sample_size: Optional[int] = 1000,
     include_columns: Optional[List[str]] = None,
-    exclude_columns: Optional[List[str]] = None
+    exclude_columns: Optional[List[str]] = None,
+    sample_df: Optional[pl.DataFrame] = None
 ) -> Schema:
     """
     Infer an Iceberg schema from a CSV file using Polars.
@@ -73,6 +120,7 @@ def infer_schema_from_csv(
         sample_size: Number of rows to sample for schema inference
         include_columns: List of column names to include (if None, include all except excluded)
         exclude_columns: List of column names to exclude (if None, no exclusions)
+        sample_df: Sample already read with read_csv_sample (skips reading the file again)
         
     Returns:
         PyIceberg Schema object
@@ -80,8 +128,11 @@ def infer_schema_from_csv(
     logger.info(f"Inferring schema from CSV file using Polars: {csv_file}")
     
     try:
-        # First check if the file exists and is accessible
-        if not os.path.exists(csv_file):
+        # First check if the file exists and is accessible. A single stat gives
+        # both the existence check and the size used to pick the sampling path
+        try:
+            file_size = os.stat(csv_file).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"CSV file not found: {csv_file}")
         
         # Log column filtering parameters if provided
@@ -91,8 +142,7 @@ def infer_schema_from_csv(
             logger.info(f"Excluding these columns: {exclude_columns}")
         
         # For large CSV files, use sampling to avoid loading the entire file
-        file_size = os.path.getsize(csv_file)
-        if file_size > 10 * 1024 * 1024:  # 10 MB
+        if sample_df is None and file_size > 10 * 1024 * 1024:  # 10 MB
             logger.info(f"CSV file size is {file_size/1024/1024:.2f} MB, using efficient sampling")
             # Use default sample size (1000) if none provided
             actual_sample_size = sample_size if sample_size is not None else 1000
@@ -107,24 +157,15 @@ def infer_schema_from_csv(
             )
         
         try:
-            # Read the CSV file with Polars
-            read_args = {
-                "separator": delimiter,
-                "has_header": has_header,
-                "quote_char": quote_char,
-                "null_values": ["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
-                "try_parse_dates": True,  # Try to parse date/datetime columns
-                "low_memory": True,
-                "ignore_errors": True,  # Skip rows with parsing errors
-                "truncate_ragged_lines": True  # Handle CSV files with inconsistent numbers of fields
-            }
-            
-            # Add n_rows and infer_schema_length only if sample_size is specified
-            if sample_size is not None:
-                read_args["n_rows"] = sample_size
-                read_args["infer_schema_length"] = sample_size
-            
-            df = pl.read_csv(csv_file, **read_args)
+            if sample_df is not None:
+                # Reuse the sample the caller already parsed
+                df = sample_df
+            else:
+                # Only parse the columns that survive include/exclude filtering
+                projected_columns = _get_projected_columns(
+                    csv_file, delimiter, has_header, quote_char, include_columns, exclude_columns
+                )
+                df = read_csv_sample(csv_file, delimiter, has_header, quote_char, sample_size, projected_columns)
         except Exception as e:
             logger.warning(f"Error reading CSV with Polars: {str(e)}")
             # Fallback to simple file reading for column names
@@ -148,29 +189,31 @@ def infer_schema_from_csv(
             logger.info(f"Created fallback schema with {len(fields)} string columns")
             return schema
         
-        # If no header was provided, generate column names
-        if not has_header:
-            df.columns = [f"col_{i}" for i in range(len(df.columns))]
-        
-        # Convert to PyArrow table to leverage better type system for Iceberg
-        arrow_table = df.to_arrow()
+        # Convert to PyArrow to leverage better type system for Iceberg (only the
+        # schema is needed, so an empty slice avoids copying the sampled rows)
+        arrow_table = df.head(0).to_arrow()
         arrow_schema = arrow_table.schema
         
+        # Set lookups for the per-column include/exclude checks
+        include_set = set(include_columns) if include_columns is not None else None
+        exclude_set = set(exclude_columns) if exclude_columns is not None else None
+        
         # Create a schema fields list for PyIceberg
         fields = []
         field_id = 1
         
         for i, field in enumerate(arrow_schema):
-            col_name = field.name
+            # Without a header row, name each column by its position as it is visited
+            col_name = field.name if has_header else f"col_{i}"
             # Clean column name - remove special characters, spaces, etc.
             clean_col_name = str(col_name).strip()
             
             # Apply column filtering
-            if include_columns is not None and clean_col_name not in include_columns:
+            if include_set is not None and clean_col_name not in include_set:
                 logger.debug(f"Skipping column '{clean_col_name}' (not in include list)")
                 continue
                 
-            if exclude_columns is not None and clean_col_name in exclude_columns:
+            if exclude_set is not None and clean_col_name in exclude_set:
                 logger.debug(f"Skipping column '{clean_col_name}' (in exclude list)")
                 continue
             
@@ -209,8 +252,9 @@ def infer_schema_from_df(df) -> Schema:
         
         # If it's a pandas DataFrame, convert to PyArrow table
         if hasattr(df, 'to_arrow'):
-            # It's a pandas DataFrame
-            arrow_table = df.to_arrow()
+            # Only the schema is needed, so convert an empty slice rather than
+            # copying every row of the batch into Arrow buffers
+            arrow_table = df.head(0).to_arrow()
         elif hasattr(df, 'to_arrow_table'):
             # It's a polars DataFrame
             arrow_table = df.to_arrow_table()
@@ -301,6 +345,55 @@ def _pyarrow_type_to_iceberg_type(pa_type: pa.DataType) -> Any:
     else:
         return StringType()
 
+def _get_projected_columns(
+    csv_file: str,
+    delimiter: str,
+    has_header: bool,
+    quote_char: str,
+    include_columns: Optional[List[str]] = None,
+    exclude_columns: Optional[List[str]] = None
+) -> Optional[List[str]]:
+    """
+    Get the CSV header columns to read after include/exclude filtering.
+    
+    Passing these to the reader means dropped columns are never parsed.
+    
+    Args:
+        csv_file: Path to the CSV file
+        delimiter: CSV delimiter character
+        has_header: Whether the CSV has a header row
+        quote_char: CSV quote character
+        include_columns: List of column names to include (if None, include all except excluded)
+        exclude_columns: List of column names to exclude (if None, no exclusions)
+        
+    Returns:
+        List of header column names to read, or None to read all columns
+    """
+    if not has_header or (include_columns is None and exclude_columns is None):
+        return None
+    
+    header = pl.read_csv(
+        csv_file,
+        separator=delimiter,
+        has_header=True,
+        quote_char=quote_char,
+        n_rows=0
+    ).columns
+    
+    include_set = set(include_columns) if include_columns is not None else None
+    exclude_set = set(exclude_columns) if exclude_columns is not None else None
+    projected = [
+        col for col in header
+        if (include_set is None or col.strip() in include_set)
+        and (exclude_set is None or col.strip() not in exclude_set)
+    ]
+    
+    # Nothing to project if every column is kept (or none are, which the
+    # caller's own filtering reports as an empty schema)
+    if not projected or len(projected) == len(header):
+        return None
+    return projected
+
 def _infer_schema_from_large_csv(
     csv_file: str, 
     delimiter: str,
@@ -311,14 +404,14 @@ def _infer_schema_from_large_csv(
     exclude_columns: Optional[List[str]] = None
 ) -> Schema:
     """
-    Infer schema from a large CSV file by sampling rows using Polars.
+    Infer schema from a large CSV file by reading a bounded number of leading rows using Polars.
     
     Args:
         csv_file: Path to the CSV file
         delimiter: CSV delimiter character
         has_header: Whether the CSV has a header row
         quote_char: CSV quote character
-        sample_size: Number of rows to sample
+        sample_size: Number of leading rows to read
         include_columns: List of column names to include (if None, include all except excluded)
         exclude_columns: List of column names to exclude (if None, no exclusions)
         
@@ -326,56 +419,38 @@ def _infer_schema_from_large_csv(
         PyIceberg Schema object
     """
     try:
-        # Get the total number of rows in the CSV file
-        # Use Polars streaming capabilities to count rows efficiently
-        row_count = pl.scan_csv(
-            csv_file,
-            separator=delimiter,
-            has_header=has_header,
-            quote_char=quote_char,
-            low_memory=True,
-            ignore_errors=True
-        ).select(pl.count()).collect().item()
-        
-        if has_header and row_count > 0:
-            row_count -= 1  # Exclude header row from count
-        
-        if sample_size is None or row_count <= sample_size:
-            # For small files or when no sample size is specified, use all rows for schema inference
-            return infer_schema_from_csv(csv_file, delimiter, has_header, quote_char, None, include_columns, exclude_columns)
-        
-        # First read the header to get column names
-        df_header = pl.read_csv(
-            csv_file,
-            separator=delimiter,
-            has_header=has_header,
-            quote_char=quote_char,
-            n_rows=1
-        )
-        
-        column_names = df_header.columns
-        
-        # Calculate a reasonable sample factor
-        # Make sure we have a valid sample_size (should be handled by the check above, but just to be safe)
+        # Make sure we have a valid sample_size
         if sample_size is None:
             sample_size = 1000
-        sample_factor = max(0.01, min(1.0, sample_size / row_count))
         
-        # Use Polars lazy API with sampling for efficient schema inference
-        df_sampled = pl.scan_csv(
+        # Read only the leading sample_size rows. Column types are inferred from the
+        # first infer_schema_length rows anyway, so counting or scanning the rest of
+        # the file would not change the resulting schema.
+        df_sampled = pl.read_csv(
             csv_file,
             separator=delimiter,
             has_header=has_header,
             quote_char=quote_char,
+            columns=_get_projected_columns(
+                csv_file, delimiter, has_header, quote_char, include_columns, exclude_columns
+            ),
             null_values=["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
+            n_rows=sample_size,
             infer_schema_length=sample_size,
             try_parse_dates=True,
             low_memory=True,
-            ignore_errors=True
-        ).collect().sample(n=sample_size, with_replacement=False)
+            ignore_errors=True,
+            truncate_ragged_lines=True
+        )
+        
+        column_names = df_sampled.columns
         
-        # Convert to PyArrow table for schema inference
-        arrow_table = df_sampled.to_arrow()
+        # Convert to PyArrow for schema inference (only the schema is needed)
+        arrow_table = df_sampled.head(0).to_arrow()
+        
+        # Set lookups for the per-column include/exclude checks
+        include_set = set(include_columns) if include_columns is not None else None
+        exclude_set = set(exclude_columns) if exclude_columns is not None else None
         
         # Create schema fields
         fields = []
@@ -386,11 +461,11 @@ def _infer_schema_from_large_csv(
             clean_col_name = str(col_name).strip()
             
             # Apply column filtering
-            if include_columns is not None and clean_col_name not in include_columns:
+            if include_set is not None and clean_col_name not in include_set:
                 logger.debug(f"Skipping column '{clean_col_name}' (not in include list)")
                 continue
                 
-            if exclude_columns is not None and clean_col_name in exclude_columns:
+            if exclude_set is not None and clean_col_name in exclude_set:
                 logger.debug(f"Skipping column '{clean_col_name}' (in exclude list)")
                 continue
             
@@ -453,7 +528,8 @@ def analyze_column_cardinality(
     has_header: bool = True,
     quote_char: str = '"',
     sample_size: int = 10000,
-    schema: Optional[Schema] = None
+    schema: Optional[Schema] = None,
+    df: Optional[pl.DataFrame] = None
 ) -> List[Dict[str, Any]]:
     """
     Analyze column cardinality from a CSV file and recommend partitioning strategies.
@@ -465,6 +541,7 @@ def analyze_column_cardinality(
         quote_char: CSV quote character
         sample_size: Number of rows to sample for analysis
         schema: Optional pre-inferred schema
+        df: Optional sample already read with read_csv_sample (skips reading the file again)
         
     Returns:
         List of dictionaries with column recommendations
@@ -473,17 +550,18 @@ def analyze_column_cardinality(
     
     try:
         # Read the CSV file with a limited sample size for analysis
-        df = pl.read_csv(
-            csv_file,
-            separator=delimiter,
-            has_header=has_header,
-            quote_char=quote_char,
-            null_values=["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
-            try_parse_dates=True,
-            n_rows=sample_size,
-            low_memory=True,
-            ignore_errors=True
-        )
+        if df is None:
+            df = pl.read_csv(
+                csv_file,
+                separator=delimiter,
+                has_header=has_header,
+                quote_char=quote_char,
+                null_values=["", "NULL", "null", "NA", "N/A", "na", "n/a", "None", "none"],
+                try_parse_dates=True,
+                n_rows=sample_size,
+                low_memory=True,
+                ignore_errors=True
+            )
         
         # Use the provided schema if available, otherwise get column metadata from DataFrame
         column_types = {}
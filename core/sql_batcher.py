@@ -4,11 +4,17 @@ SQL batching module for efficient execution of multiple SQL statements.
 This module provides a reusable batching mechanism for SQL statements
 to optimize execution while respecting query size limits.
 """
+import itertools
 import logging
-from typing import Callable, List, Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Any, Optional, Literal
 
 logger = logging.getLogger(__name__)
 
+# Everything up to and including VALUES in a plain INSERT ... VALUES statement
+_INSERT_VALUES_PREFIX_RE = re.compile(r'^\s*INSERT\s+INTO\s+[^\s(]+\s*(?:\([^)]*\)\s*)?VALUES\s*', re.IGNORECASE)
+
 class SQLBatcher:
     """
     Batches SQL statements for efficient execution based on size limits.
@@ -17,55 +23,155 @@ class SQLBatcher:
     exceeding query size limits while optimizing for performance.
     """
     
-    def __init__(self, max_bytes: int = 700_000, delimiter: str = ";\n", dry_run: bool = False):
+    def __init__(self, max_bytes: int = 700_000, delimiter: str = ";\n", dry_run: bool = False, fuse_inserts: bool = True,
+                 max_parallel: int = 1, strategy: Literal['joined', 'per_statement'] = 'per_statement'):
         """
         Initialize a new SQL batcher.
         
         Args:
             max_bytes: Maximum size in bytes of each statement batch (default: 700,000)
-            delimiter: Delimiter used for size calculation only (actual execution is per statement)
+            delimiter: Delimiter placed between the statements of a batch (counted in its size)
             dry_run: If True, just logs the queries without executing (default: False)
+            fuse_inserts: If True, adjacent INSERT ... VALUES statements with the same target
+                and column list are merged into one multi-row INSERT (default: True)
+            max_parallel: Maximum number of statements of a batch executed concurrently
+                (default: 1, sequential). Only for independent statements; the execute
+                callback must then be safe to call from several threads
+            strategy: How a batch is executed: 'joined' passes all its statements to the
+                callback as one delimiter-joined string, 'per_statement' passes them one
+                at a time, for engines such as Trino that run one statement per query
+                (default: 'per_statement', which is safe for any engine)
         """
+        if strategy not in ('joined', 'per_statement'):
+            raise ValueError(f"Unknown SQL batching strategy: {strategy}")
+        
         self.max_bytes = max_bytes
-        self.delimiter = delimiter  # Only used for size calculation, not for joining
+        self.strategy = strategy
+        self.delimiter = delimiter
+        self._delimiter_size = len(delimiter.encode("utf-8"))
         self.dry_run = dry_run
+        self.fuse_inserts = fuse_inserts
+        self.max_parallel = max_parallel
         self.total_statements_processed = 0
         self.reset()
-        logger.debug(f"Initialized SQLBatcher with max_bytes={max_bytes}, dry_run={dry_run}")
+        logger.debug("Initialized SQLBatcher with max_bytes=%d, dry_run=%s", max_bytes, dry_run)
     
     def reset(self) -> None:
         """Reset the current batch."""
         self.current_batch = []
         self.current_size = 0
+        self.statements_in_batch = 0
+        # Open group of INSERTs being fused: the shared prefix and each VALUES list
+        self._insert_prefix = None
+        self._insert_values = []
+    
+    def _close_insert_group(self) -> None:
+        """Append the open group of fused INSERTs to the batch as one statement."""
+        if self._insert_values:
+            self.current_batch.append(f"{self._insert_prefix}{', '.join(self._insert_values)}")
+        self._insert_prefix = None
+        self._insert_values = []
     
     def add_statement(self, sql: str) -> bool:
         """
         Add a SQL statement to the current batch.
         
+        Deprecated: use add_or_flush, which flushes a full batch itself instead of
+        having the caller flush and add the statement a second time.
+        
         Args:
             sql: The SQL statement to add to the batch
             
         Returns:
-            True if the batch is full after adding this statement, False otherwise
+            True if the statement doesn't fit and wasn't added (the caller should flush
+            and add it again), False if it was added
+        """
+        return self._add_statement(sql)
+    
+    def add_or_flush(self, sql: str, execute_callback: Callable[[str], Any],
+                     query_collector: Optional[Any] = None,
+                     metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add a SQL statement to the current batch, flushing the batch first if it's full.
+        
+        Args:
+            sql: The SQL statement to add to the batch
+            execute_callback: Function to call with each SQL statement when flushing
+            query_collector: Optional query collector for dry run mode
+            metadata: Additional metadata for the query collector
+        """
+        self._add_statement(sql, execute_callback, query_collector, metadata)
+    
+    def _add_statement(self, sql: str, execute_callback: Optional[Callable[[str], Any]] = None,
+                       query_collector: Optional[Any] = None,
+                       metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Add a SQL statement to the current batch, measuring it only once.
+        
+        Args:
+            sql: The SQL statement to add to the batch
+            execute_callback: Function used to flush a full batch; if None, a statement
+                that doesn't fit is left to the caller
+            query_collector: Optional query collector for dry run mode
+            metadata: Additional metadata for the query collector
+            
+        Returns:
+            True if the statement didn't fit and no callback was given to flush with
+        """
+        # Calculate the size in bytes. ASCII text is one byte per character, so the
+        # statement only needs encoding (just to measure it) when it isn't ASCII
+        is_ascii = sql.isascii()
+        sql_size = len(sql) if is_ascii else len(sql.encode("utf-8"))
+        has_statements = bool(self.current_batch or self._insert_values)
+        
+        insert_match = _INSERT_VALUES_PREFIX_RE.match(sql) if self.fuse_inserts else None
+        if insert_match and insert_match.group(0) == self._insert_prefix:
+            # Same target and columns as the open group: only this statement's
+            # VALUES list is added, after a ", " separator
+            prefix_size = insert_match.end() if is_ascii else len(self._insert_prefix.encode("utf-8"))
+            size = sql_size - prefix_size + 2
+            if self.current_size + size <= self.max_bytes:
+                self._insert_values.append(sql[insert_match.end():])
+                self.current_size += size
+                self.statements_in_batch += 1
+                return False
+        else:
+            # Add delimiter size if this isn't the first statement
+            size = sql_size + (self._delimiter_size if has_statements else 0)
+            if not has_statements or self.current_size + size <= self.max_bytes:
+                self._append_statement(sql, insert_match, size)
+                return False
+        
+        # The statement doesn't fit in the current batch
+        if execute_callback is None:
+            return True  # Caller should flush before adding
+        self.flush(execute_callback, query_collector, metadata)
+        
+        # It starts the new batch, so no delimiter is counted
+        self._append_statement(sql, insert_match, sql_size)
+        return False
+    
+    def _append_statement(self, sql: str, insert_match: Optional[re.Match], size: int) -> None:
         """
-        # Calculate the size in bytes
-        encoded = sql.encode("utf-8")
-        # Add delimiter size if this isn't the first statement
-        delimiter_size = len(self.delimiter.encode("utf-8")) if self.current_batch else 0
-        size = len(encoded) + delimiter_size
+        Append a statement to the batch, opening a new group of fused INSERTs if it's an INSERT.
         
+        Args:
+            sql: The SQL statement to append
+            insert_match: Match of the INSERT ... VALUES prefix, or None
+            size: Size in bytes the statement adds to the batch
+        """
         # If this statement alone exceeds the max size, log a warning
         if size > self.max_bytes:
             logger.warning(f"Single SQL statement exceeds max size: {size} bytes > {self.max_bytes} bytes")
-            
-        # Check if adding this statement would exceed the batch size
-        if self.current_size + size > self.max_bytes and self.current_batch:
-            return True  # Caller should flush before adding
         
-        # Add the statement to the batch
-        self.current_batch.append(sql)
+        self._close_insert_group()
+        if insert_match:
+            self._insert_prefix = insert_match.group(0)
+            self._insert_values.append(sql[insert_match.end():])
+        else:
+            self.current_batch.append(sql)
         self.current_size += size
-        return False
+        self.statements_in_batch += 1
     
     def flush(self, execute_callback: Callable[[str], Any], 
              query_collector: Optional[Any] = None,
@@ -78,51 +184,87 @@ class SQLBatcher:
             query_collector: Optional query collector for dry run mode
             metadata: Additional metadata for the query collector
         """
+        self._close_insert_group()
         if not self.current_batch:
             return
         
-        statements_count = len(self.current_batch)
-        self.total_statements_processed += statements_count
+        # Count the statements the caller added, however many were fused together
+        self.total_statements_processed += self.statements_in_batch
         
-        logger.debug(f"Flushing SQL statements ({self.current_size} bytes, {statements_count} statements)")
+        # The joined strategy sends the whole batch as a single SQL string
+        if self.strategy == 'joined':
+            statements = [self.delimiter.join(self.current_batch)]
+        else:
+            statements = self.current_batch
+        statements_count = len(statements)
+        
+        # Log calls here run for every flush and statement, so their arguments are
+        # passed for lazy formatting rather than built into f-strings up front
+        logger.debug("Flushing SQL statements (%d bytes, %d statements)", self.current_size, statements_count)
         
         if self.dry_run:
-            logger.info(f"[DRY RUN] SQL batch with {statements_count} statements ({self.current_size} bytes)")
+            logger.info("[DRY RUN] SQL batch with %d statements (%d bytes)", statements_count, self.current_size)
             
             # If we have a query collector, add the queries to it
             if query_collector and metadata:
-                for i, statement in enumerate(self.current_batch):
-                    logger.debug(f"[DRY RUN] SQL statement {i+1}/{statements_count}")
+                for i, statement in enumerate(statements):
+                    logger.debug("[DRY RUN] SQL statement %d/%d", i + 1, statements_count)
                     query_collector.add_query(
                         statement,
                         metadata.get("type", "DML"),
                         metadata.get("row_count", 1),  # One row count per statement
                         metadata.get("table_name", "unknown")
                     )
+        elif self.max_parallel > 1 and statements_count > 1:
+            self._execute_parallel(statements, execute_callback)
         else:
             # Execute each statement individually
             success_count = 0
             try:
-                for i, statement in enumerate(self.current_batch):
-                    try:
-                        logger.debug(f"Executing SQL statement {i+1}/{statements_count}")
-                        execute_callback(statement)
-                        success_count += 1
-                    except Exception as inner_e:
-                        logger.error(f"Error executing SQL statement {i+1}: {str(inner_e)}")
-                        raise inner_e
-                        
-                logger.info(f"Successfully executed {success_count}/{statements_count} SQL statements")
+                for i, statement in enumerate(statements):
+                    logger.debug("Executing SQL statement %d/%d", i + 1, statements_count)
+                    execute_callback(statement)
+                    success_count += 1
             except Exception as e:
-                logger.error(f"Error executing SQL batch: {str(e)}", exc_info=True)
+                # Logged once, without a traceback: the original exception, traceback
+                # included, stays attached to the RuntimeError as its cause
+                logger.error(f"Error executing SQL statement {success_count + 1}/{statements_count}: {str(e)}")
                 raise RuntimeError(f"Failed to execute SQL batch: {str(e)}") from e
+            
+            logger.info("Successfully executed %d/%d SQL statements", success_count, statements_count)
         
         self.reset()
     
+    def _execute_parallel(self, statements: List[str], execute_callback: Callable[[str], Any]) -> None:
+        """
+        Execute the statements of the current batch concurrently.
+        
+        Statements that haven't started are cancelled once any statement fails.
+        
+        Args:
+            statements: SQL statements to execute
+            execute_callback: Function to call with each SQL statement
+        """
+        statements_count = len(statements)
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, statements_count)) as executor:
+            futures = {executor.submit(execute_callback, statement): i
+                       for i, statement in enumerate(statements)}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    for pending in futures:
+                        pending.cancel()
+                    logger.error(f"Error executing SQL statement {futures[future] + 1}/{statements_count}: {str(e)}")
+                    raise RuntimeError(f"Failed to execute SQL batch: {str(e)}") from e
+        
+        logger.info("Successfully executed %d/%d SQL statements", statements_count, statements_count)
+    
     def process_statements(self, sql_statements: List[str], 
                           execute_callback: Callable[[str], Any],
                           query_collector: Optional[Any] = None,
-                          metadata: Optional[Dict[str, Any]] = None) -> int:
+                          metadata: Optional[Dict[str, Any]] = None,
+                          group_key: Optional[Callable[[str], Any]] = None) -> int:
         """
         Batch-process a sequence of SQL statements.
         
@@ -131,15 +273,22 @@ class SQLBatcher:
             execute_callback: Function to call with each batch
             query_collector: Optional query collector for dry run mode
             metadata: Additional metadata for the query collector
+            group_key: Optional function mapping a statement to a key, such as its target
+                table. Each run of consecutive statements with the same key is flushed
+                as its own batches, so no batch mixes keys. Statement order is kept
             
         Returns:
             Total number of statements processed
         """
-        for sql in sql_statements:
-            if self.add_statement(sql):
+        if group_key is None:
+            for sql in sql_statements:
+                self.add_or_flush(sql, execute_callback, query_collector, metadata)
+        else:
+            for _, run in itertools.groupby(sql_statements, key=group_key):
+                for sql in run:
+                    self.add_or_flush(sql, execute_callback, query_collector, metadata)
                 self.flush(execute_callback, query_collector, metadata)
-                self.add_statement(sql)  # Add the current statement to the new batch
-                
+        
         # Flush any remaining statements
         self.flush(execute_callback, query_collector, metadata)
         
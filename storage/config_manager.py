@@ -3,7 +3,9 @@ Configuration management module for CSV to Iceberg conversion
 """
 import os
 import json
+import copy
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
 # Default config file location
@@ -25,6 +27,25 @@ DEFAULT_PROFILE = {
     "description": "Default connection profile"
 }
 
+@lru_cache(maxsize=64)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a configuration file, memoized on its path, mtime and size.
+    
+    The stat fields are only part of the cache key, so rewriting the file
+    invalidates the cached entry.
+    
+    Args:
+        path: Absolute path to the configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Parsed configuration data
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
 class ConfigManager:
     """Manager for configuration profiles"""
     
@@ -43,18 +64,22 @@ class ConfigManager:
     def _load_config(self) -> None:
         """Load configuration from file."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self._config_data = json.load(f)
-                self.logger.debug(f"Loaded configuration from {self.config_file}")
-            else:
-                # Initialize with default configuration
-                self._config_data = {
-                    "profiles": [DEFAULT_PROFILE],
-                    "last_used_profile": "Default"
-                }
-                self._save_config()
-                self.logger.debug(f"Created default configuration in {self.config_file}")
+            # Stat directly rather than checking existence first, so a missing
+            # file is detected by the same syscall that keys the parse cache.
+            # The cached data is copied because profile edits mutate it in place
+            path = os.path.abspath(self.config_file)
+            st = os.stat(path)
+            self._config_data = copy.deepcopy(
+                _parse_config_file(path, st.st_mtime_ns, st.st_size))
+            self.logger.debug(f"Loaded configuration from {self.config_file}")
+        except FileNotFoundError:
+            # Initialize with default configuration
+            self._config_data = {
+                "profiles": [DEFAULT_PROFILE],
+                "last_used_profile": "Default"
+            }
+            self._save_config()
+            self.logger.debug(f"Created default configuration in {self.config_file}")
         except Exception as e:
             self.logger.error(f"Error loading configuration: {str(e)}")
             # If loading fails, initialize with default configuration
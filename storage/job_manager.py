@@ -6,6 +6,7 @@ import datetime
 import logging
 import time
 from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from typing import Dict, List, Optional, Any, Union
 
 # Try to import LMDB job store
@@ -137,6 +138,19 @@ class JobManager:
         
         return None
         
+    @contextmanager
+    def batch(self):
+        """
+        Group job operations so the persistent store commits them together.
+        
+        Creating a job and recording its progress and completion takes several
+        separate store writes, each synced to disk. Inside this block they share a
+        single LMDB transaction. Without LMDB this has no effect.
+        """
+        store_batch = self.lmdb_store.batch() if self.use_lmdb and self.lmdb_store else nullcontext()
+        with store_batch:
+            yield
+        
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Update an existing job.
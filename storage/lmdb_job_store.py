@@ -6,6 +6,8 @@ import json
 import time
 import logging
 import datetime
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any, Union
 
 try:
@@ -67,6 +69,43 @@ class LMDBJobStore:
         # Create a separate database for job ID index (sorted by timestamp)
         self.index_db = self.env.open_db(b'job_index')
         
+        # Write transaction shared by the calls made inside batch(), per thread
+        self._local = threading.local()
+        
+    @contextmanager
+    def batch(self):
+        """Run the store operations made inside the block in one write transaction.
+        
+        Every standalone write commits (and syncs to disk) on its own. Inside the
+        block, reads and writes on this thread share a single transaction that is
+        committed once when the block exits. Other threads' writes wait for it.
+        Nested blocks reuse the outer transaction.
+        """
+        if getattr(self._local, 'txn', None) is not None:
+            yield
+            return
+        
+        with self.env.begin(write=True) as txn:
+            self._local.txn = txn
+            try:
+                yield
+            finally:
+                self._local.txn = None
+    
+    @contextmanager
+    def _begin(self, write: bool = False):
+        """Open a transaction, or reuse the one of the enclosing batch().
+        
+        Args:
+            write: Whether the transaction needs write access
+        """
+        txn = getattr(self._local, 'txn', None)
+        if txn is not None:
+            yield txn
+        else:
+            with self.env.begin(write=write) as txn:
+                yield txn
+        
     def serialize_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare job data for serialization.
         
@@ -172,12 +211,12 @@ class LMDBJobStore:
             logger.info(f"Adding job {job_id} to LMDB with index key {index_key.decode('utf-8')}")
             
             # Store job data and update index
-            with self.env.begin(write=True) as txn:
+            with self._begin(write=True) as txn:
                 txn.put(job_key, job_value)
                 txn.put(index_key, job_key, db=self.index_db)
 
             # Debug: Check if job was added correctly
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 value = txn.get(job_key)
                 index_value = txn.get(index_key, db=self.index_db)
                 
@@ -245,7 +284,7 @@ class LMDBJobStore:
             if update_index:
                 # First find and remove old index key
                 old_index_key = None
-                with self.env.begin() as txn:
+                with self._begin() as txn:
                     cursor = txn.cursor(db=self.index_db)
                     if cursor.first():
                         while True:
@@ -265,7 +304,7 @@ class LMDBJobStore:
                 new_index_key = f"{reverse_timestamp:012d}:{job_id}".encode('utf-8')
                 
                 # Update both job data and index
-                with self.env.begin(write=True) as txn:
+                with self._begin(write=True) as txn:
                     txn.put(job_key, job_value)
                     if old_index_key:
                         txn.delete(old_index_key, db=self.index_db)
@@ -274,7 +313,7 @@ class LMDBJobStore:
                 logger.debug(f"Updated job {job_id} in LMDB with new index key")
             else:
                 # Just update the job data
-                with self.env.begin(write=True) as txn:
+                with self._begin(write=True) as txn:
                     txn.put(job_key, job_value)
                     
                 logger.debug(f"Updated job {job_id} in LMDB (data only)")
@@ -298,7 +337,7 @@ class LMDBJobStore:
             logger.debug(f"LMDB store get_job called for job_id: {job_id}")
             job_key = job_id.encode('utf-8')
             
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 job_value = txn.get(job_key)
                 
             if job_value:
@@ -311,7 +350,7 @@ class LMDBJobStore:
                 logger.warning(f"Job {job_id} not found in LMDB")
                 # Try to list all jobs to see if we can find it in a different way
                 all_job_keys = []
-                with self.env.begin() as txn:
+                with self._begin() as txn:
                     cursor = txn.cursor()
                     if cursor.first():
                         while True:
@@ -343,7 +382,7 @@ class LMDBJobStore:
             
             # First, check how many jobs we have in total
             all_job_keys = []
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 cursor = txn.cursor()
                 if cursor.first():
                     while True:
@@ -355,7 +394,7 @@ class LMDBJobStore:
             
             # Check index database size
             index_entries = []
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 cursor = txn.cursor(db=self.index_db)
                 if cursor.first():
                     while True:
@@ -367,7 +406,7 @@ class LMDBJobStore:
             
             logger.info(f"LMDB job index contains {len(index_entries)} entries: {index_entries}")
             
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 # Use the sorted index to get jobs by timestamp (newest first)
                 cursor = txn.cursor(db=self.index_db)
                 
@@ -433,7 +472,7 @@ class LMDBJobStore:
             # We need to find and delete the index entry as well
             index_key = None
             
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 # Find the index key for this job
                 cursor = txn.cursor(db=self.index_db)
                 if cursor.first():
@@ -449,7 +488,7 @@ class LMDBJobStore:
                             break
             
             # Now delete both entries
-            with self.env.begin(write=True) as txn:
+            with self._begin(write=True) as txn:
                 txn.delete(job_key)
                 if index_key:
                     txn.delete(index_key, db=self.index_db)
@@ -476,7 +515,7 @@ class LMDBJobStore:
             jobs_count = 0
             jobs_to_delete = []
             
-            with self.env.begin() as txn:
+            with self._begin() as txn:
                 # Count total jobs and find old ones
                 cursor = txn.cursor(db=self.index_db)
                 
@@ -511,7 +550,7 @@ class LMDBJobStore:
                 extra_jobs_to_delete = jobs_count - MAX_JOBS_TO_KEEP - len(jobs_to_delete)
                 
                 if extra_jobs_to_delete > 0:
-                    with self.env.begin() as txn:
+                    with self._begin() as txn:
                         cursor = txn.cursor(db=self.index_db)
                         
                         # Start from oldest job
@@ -528,7 +567,7 @@ class LMDBJobStore:
                                     
             # Now delete the old/excess jobs
             if jobs_to_delete:
-                with self.env.begin(write=True) as txn:
+                with self._begin(write=True) as txn:
                     for index_key_str in jobs_to_delete:
                         index_key = index_key_str.encode('utf-8')
                         
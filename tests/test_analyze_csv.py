@@ -0,0 +1,74 @@
+"""
+Unit tests for the CSV analysis route of the web interface.
+"""
+import unittest
+import io
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+class TestAnalyzeCSV(unittest.TestCase):
+    """Test cases for the /analyze-csv route."""
+    
+    @classmethod
+    def setUpClass(cls):
+        # The job and config stores open LMDB environments under the home directory
+        # when the routes are imported, so keep them out of the real one
+        cls._home = tempfile.TemporaryDirectory()
+        cls._old_home = os.environ.get('HOME')
+        os.environ['HOME'] = cls._home.name
+        cls._upload_dir = tempfile.TemporaryDirectory()
+        cls._old_tmpdir = os.environ.get('CSV2ICEBERG_TMPDIR')
+        os.environ['CSV2ICEBERG_TMPDIR'] = cls._upload_dir.name
+        
+        from web.app import create_app
+        cls.client = create_app().test_client()
+    
+    @classmethod
+    def tearDownClass(cls):
+        for name, value in (('HOME', cls._old_home), ('CSV2ICEBERG_TMPDIR', cls._old_tmpdir)):
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        cls._upload_dir.cleanup()
+        cls._home.cleanup()
+    
+    def analyze(self, data, **form):
+        """Post CSV data to the route and return the response."""
+        form.setdefault('has_header', 'true')
+        form['csv_file'] = (io.BytesIO(data), 'test.csv')
+        return self.client.post('/analyze-csv', data=form, content_type='multipart/form-data')
+    
+    def test_valid_csv(self):
+        """Test that a well-formed CSV gets an inferred schema."""
+        response = self.analyze(b"id,name\n1,alice\n2,bob\n")
+        
+        self.assertEqual(response.status_code, 200)
+        columns = response.get_json()['schema']
+        self.assertEqual([column['name'] for column in columns], ['id', 'name'])
+    
+    def test_unparseable_sample_falls_back(self):
+        """Test that a sample polars can't parse still gets the fallback string schema."""
+        cases = [
+            # Unclosed quote
+            (b'id,name\n1,"alice\n2,bob\n', ','),
+            # Delimiter longer than one character
+            (b"id,name\n1,alice\n", 'ab'),
+        ]
+        for data, delimiter in cases:
+            with self.subTest(delimiter=delimiter):
+                response = self.analyze(data, delimiter=delimiter)
+                
+                self.assertEqual(response.status_code, 200)
+                columns = response.get_json()['schema']
+                self.assertTrue(columns)
+                self.assertTrue(all(column['type'] == 'string' for column in columns))
+        
+        # The uploads are removed even though the sample couldn't be parsed
+        self.assertEqual(os.listdir(self._upload_dir.name), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ from unittest.mock import Mock, call
 
 import sys
 import os
+import threading
+import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.sql_batcher import SQLBatcher
 
@@ -15,7 +17,7 @@ class TestSQLBatcher(unittest.TestCase):
     def test_basic_batching(self):
         """Test basic batching functionality."""
         # Create a batcher with a small max size
-        batcher = SQLBatcher(max_bytes=50)
+        batcher = SQLBatcher(max_bytes=50, strategy='joined')
         
         # Create a mock execute function
         mock_execute = Mock()
@@ -66,7 +68,7 @@ class TestSQLBatcher(unittest.TestCase):
     
     def test_dry_run_mode(self):
         """Test dry run mode."""
-        batcher = SQLBatcher(dry_run=True)
+        batcher = SQLBatcher(dry_run=True, strategy='joined')
         mock_execute = Mock()
         mock_collector = Mock()
         
@@ -86,7 +88,7 @@ class TestSQLBatcher(unittest.TestCase):
     def test_custom_delimiter(self):
         """Test custom delimiter."""
         # Use a custom delimiter
-        batcher = SQLBatcher(max_bytes=100, delimiter=" UNION ALL ")
+        batcher = SQLBatcher(max_bytes=100, delimiter=" UNION ALL ", strategy='joined')
         mock_execute = Mock()
         
         statements = ["SELECT 1", "SELECT 2"]
@@ -97,6 +99,153 @@ class TestSQLBatcher(unittest.TestCase):
         # Verify the statements were combined with the custom delimiter
         mock_execute.assert_called_once_with("SELECT 1 UNION ALL SELECT 2")
     
+    def test_per_statement_strategy(self):
+        """Test that the per-statement strategy executes statements one at a time."""
+        batcher = SQLBatcher(max_bytes=100, strategy='per_statement')
+        mock_execute = Mock()
+        
+        count = batcher.process_statements(["SELECT 1", "SELECT 2"], mock_execute)
+        
+        self.assertEqual(count, 2)
+        mock_execute.assert_has_calls([call("SELECT 1"), call("SELECT 2")])
+        self.assertEqual(mock_execute.call_count, 2)
+    
+    def test_unknown_strategy(self):
+        """Test that an unknown strategy is rejected."""
+        with self.assertRaises(ValueError):
+            SQLBatcher(strategy='parallel')
+    
+    def test_add_or_flush(self):
+        """Test that add_or_flush flushes a full batch before adding to it."""
+        batcher = SQLBatcher(max_bytes=20, strategy='joined')
+        mock_execute = Mock()
+        
+        # Two 8-byte statements and the 2-byte delimiter fill the batch
+        batcher.add_or_flush("SELECT 1", mock_execute)
+        batcher.add_or_flush("SELECT 2", mock_execute)
+        mock_execute.assert_not_called()
+        
+        # The third doesn't fit, so the first two are flushed and it starts a new batch
+        batcher.add_or_flush("SELECT 3", mock_execute)
+        mock_execute.assert_called_once_with("SELECT 1;\nSELECT 2")
+        self.assertEqual(batcher.current_batch, ["SELECT 3"])
+        self.assertEqual(batcher.current_size, 8)
+    
+    def test_group_key(self):
+        """Test that runs of statements with the same group key are batched separately."""
+        batcher = SQLBatcher(max_bytes=1000, strategy='joined')
+        mock_execute = Mock()
+        
+        statements = [
+            "UPDATE a SET x = 1",
+            "UPDATE a SET x = 2",
+            "UPDATE b SET x = 3",
+            "UPDATE a SET x = 4"
+        ]
+        
+        count = batcher.process_statements(statements, mock_execute,
+                                           group_key=lambda sql: sql.split()[1])
+        
+        self.assertEqual(count, 4)
+        self.assertEqual(mock_execute.call_args_list, [
+            call("UPDATE a SET x = 1;\nUPDATE a SET x = 2"),
+            call("UPDATE b SET x = 3"),
+            call("UPDATE a SET x = 4")
+        ])
+    
+    def test_multibyte_statement_size(self):
+        """Test that sizes are measured in UTF-8 bytes, not characters."""
+        batcher = SQLBatcher(max_bytes=100)
+        
+        # 11 characters, two of which take two bytes each in UTF-8
+        batcher.add_statement("SELECT 'éé'")
+        self.assertEqual(batcher.current_size, 13)
+        
+        # ASCII statements count one byte per character, plus the delimiter
+        batcher.add_statement("SELECT 1")
+        self.assertEqual(batcher.current_size, 13 + 2 + 8)
+        
+    def test_fuse_inserts(self):
+        """Test that adjacent INSERTs into the same table are fused."""
+        batcher = SQLBatcher(strategy='per_statement')
+        mock_execute = Mock()
+        
+        statements = [
+            'INSERT INTO t ("a", "b") VALUES (1, \'x\')',
+            'INSERT INTO t ("a", "b") VALUES (2, \'y\'), (3, \'z\')',
+            'INSERT INTO u VALUES (4)',
+            "DELETE FROM t",
+            'INSERT INTO t ("a", "b") VALUES (5, \'w\')'
+        ]
+        
+        count = batcher.process_statements(statements, mock_execute)
+        
+        # Every statement counts as processed, but only four are executed
+        self.assertEqual(count, 5)
+        mock_execute.assert_has_calls([
+            call('INSERT INTO t ("a", "b") VALUES (1, \'x\'), (2, \'y\'), (3, \'z\')'),
+            call('INSERT INTO u VALUES (4)'),
+            call("DELETE FROM t"),
+            call('INSERT INTO t ("a", "b") VALUES (5, \'w\')')
+        ])
+        self.assertEqual(mock_execute.call_count, 4)
+    
+    def test_fuse_inserts_respects_max_bytes(self):
+        """Test that fused INSERTs stay within the size limit."""
+        batcher = SQLBatcher(max_bytes=35, strategy='per_statement')
+        mock_execute = Mock()
+        
+        # Each statement is 24 bytes and fusing another adds 5, so three fit per batch
+        statements = [f"INSERT INTO t VALUES ({i})" for i in range(1, 10)]
+        
+        batcher.process_statements(statements, mock_execute)
+        
+        mock_execute.assert_has_calls([
+            call("INSERT INTO t VALUES (1), (2), (3)"),
+            call("INSERT INTO t VALUES (4), (5), (6)"),
+            call("INSERT INTO t VALUES (7), (8), (9)")
+        ])
+    
+    def test_fuse_inserts_disabled(self):
+        """Test that INSERTs are executed as given when fusing is disabled."""
+        batcher = SQLBatcher(fuse_inserts=False, strategy='per_statement')
+        mock_execute = Mock()
+        
+        statements = ["INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (2)"]
+        batcher.process_statements(statements, mock_execute)
+        
+        self.assertEqual(mock_execute.call_count, 2)
+    
+    def test_parallel_execution(self):
+        """Test that statements run concurrently when max_parallel > 1."""
+        batcher = SQLBatcher(max_parallel=4, strategy='per_statement')
+        running = []
+        peak = []
+        lock = threading.Lock()
+        
+        def execute(statement):
+            with lock:
+                running.append(statement)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(statement)
+        
+        statements = [f"SELECT {i}" for i in range(8)]
+        count = batcher.process_statements(statements, execute)
+        
+        self.assertEqual(count, 8)
+        self.assertEqual(len(peak), 8)
+        self.assertGreater(max(peak), 1)
+    
+    def test_parallel_exception_handling(self):
+        """Test that a failing statement fails the batch in parallel mode."""
+        batcher = SQLBatcher(max_parallel=2, strategy='per_statement')
+        mock_execute = Mock(side_effect=[None, Exception("Test exception"), None])
+        
+        with self.assertRaises(RuntimeError):
+            batcher.process_statements(["SELECT 1", "SELECT 2", "SELECT 3"], mock_execute)
+    
     def test_exception_handling(self):
         """Test exception handling during execution."""
         batcher = SQLBatcher()
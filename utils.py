@@ -2,6 +2,7 @@
 Utility functions for CSV to Iceberg conversion
 """
 import os
+import re
 import sys
 import logging
 import socket
@@ -227,6 +228,8 @@ def get_file_size(file_path: str) -> int:
     except (FileNotFoundError, OSError):
         return 0
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
 def format_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -239,12 +242,10 @@ def format_size(size_bytes: int) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit directly
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.2f} {_SIZE_UNITS[unit_index]}"
 
 def get_trino_role_header(role: str) -> Dict[str, str]:
     """
@@ -398,6 +399,55 @@ def format_status(status: str) -> str:
     
     return status_map.get(status.lower(), status.capitalize())
 
+# A comma together with any whitespace around it
+_COLUMN_LIST_SEPARATOR_RE = re.compile(r'\s*,\s*')
+
+def parse_column_list(columns: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated list of column names.
+    
+    Whitespace around the names is dropped, as are empty entries. The names are
+    interned, since they are looked up in column name sets for every CSV batch.
+    
+    Args:
+        columns: Comma-separated column names
+        
+    Returns:
+        List of column names, or None if no names were given
+    """
+    if not columns:
+        return None
+    names = [sys.intern(name) for name in _COLUMN_LIST_SEPARATOR_RE.split(columns.strip()) if name]
+    return names or None
+
+def get_env_int(name: str, default: int) -> int:
+    """
+    Read an integer setting from an environment variable.
+    
+    An unset or empty variable gives the default. A value that isn't an integer
+    also gives the default, with a warning, rather than failing whatever reads it.
+    
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is unset or invalid
+        
+    Returns:
+        Integer value of the variable, or the default
+    """
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.getLogger("csv_to_iceberg").warning(
+            f"Ignoring invalid value {value!r} for {name}, using {default}"
+        )
+        return default
+
+# Any character that isn't a letter, digit or underscore (same test as str.isalnum)
+_INVALID_COLUMN_CHARS_RE = re.compile(r'\W')
+
 def clean_column_name(name: str) -> str:
     """
     Clean a column name for use in SQL statements.
@@ -412,7 +462,7 @@ def clean_column_name(name: str) -> str:
         return "unnamed_column"
         
     # Replace all special characters (including parentheses) with underscores
-    cleaned = "".join(c if c.isalnum() or c == '_' else '_' for c in str(name).strip())
+    cleaned = _INVALID_COLUMN_CHARS_RE.sub('_', str(name).strip())
     
     # Ensure name starts with a letter or underscore
     if cleaned and not (cleaned[0].isalpha() or cleaned[0] == '_'):
@@ -7,7 +7,9 @@ from flask import (
 )
 from werkzeug.utils import secure_filename
 import os
+import errno
 import json
+import shutil
 import uuid
 from datetime import datetime, timedelta
 import tempfile
@@ -100,7 +102,7 @@ from connectors.trino_client import TrinoClient
 from core.schema_inferrer import infer_schema_from_csv
 from utils import (
     clean_column_name, get_trino_role_header, get_file_size, is_test_job_id, 
-    format_duration, format_datetime, format_size, format_status
+    format_duration, format_datetime, format_size, format_status, parse_column_list
 )
 
 # Blueprint for routes
@@ -113,7 +115,44 @@ config_manager = LMDBConfigManager()
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Linux tmpfs, used for uploads that are deleted before the request returns
+_SHM_DIR = '/dev/shm'
+_SHM_AVAILABLE = os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK)
+
 # Helper functions
+def get_upload_dir(transient=False, size=None):
+    """
+    Get the directory to save uploaded CSV files in.
+    
+    The CSV2ICEBERG_TMPDIR environment variable overrides the location. Otherwise,
+    transient uploads that are removed within the same request go to /dev/shm when
+    it is available and has room for them, so they never hit the disk, and
+    everything else goes to the uploads directory.
+    
+    Args:
+        transient: Whether the file is removed before the request returns
+        size: Size of the upload in bytes, if known. /dev/shm is RAM-backed (and
+            only 64MB by default in Docker), so uploads of unknown size or larger
+            than its free space go to the uploads directory
+    """
+    upload_dir = os.environ.get('CSV2ICEBERG_TMPDIR')
+    if not upload_dir:
+        if transient and size is not None and _shm_has_room(size):
+            upload_dir = _SHM_DIR
+        else:
+            upload_dir = os.path.join(os.getcwd(), 'uploads')
+    os.makedirs(upload_dir, exist_ok=True)
+    return upload_dir
+
+def _shm_has_room(size):
+    """Check whether /dev/shm is usable and has at least size bytes free."""
+    if not _SHM_AVAILABLE:
+        return False
+    try:
+        return size <= shutil.disk_usage(_SHM_DIR).free
+    except OSError:
+        return False
+
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension."""
     ALLOWED_EXTENSIONS = {'csv', 'txt'}
@@ -189,43 +228,70 @@ def analyze_csv():
         has_header = request.form.get('has_header') == 'true'
         sample_size = int(request.form.get('sample_size', 1000))
         
-        # Save the file temporarily
-        temp_dir = os.path.join(os.getcwd(), 'uploads')
-        os.makedirs(temp_dir, exist_ok=True)
+        # Save the file temporarily (it is removed once the schema is inferred)
+        temp_dir = get_upload_dir(transient=True, size=request.content_length)
         
         file_id = str(uuid.uuid4())
-        file_path = os.path.join(temp_dir, f'{file_id}_{secure_filename(csv_file.filename)}')
-        
-        csv_file.save(file_path)
+        file_name = f'{file_id}_{secure_filename(csv_file.filename)}'
+        file_path = os.path.join(temp_dir, file_name)
         
-        # Infer schema
-        schema = infer_schema_from_csv(
-            csv_file=file_path,
-            delimiter=delimiter,
-            quote_char=quote_char,
-            has_header=has_header,
-            sample_size=sample_size
-        )
-        
-        # Generate partition recommendations
-        from core.schema_inferrer import analyze_column_cardinality
-        partition_recommendations = analyze_column_cardinality(
-            csv_file=file_path,
-            delimiter=delimiter,
-            has_header=has_header,
-            quote_char=quote_char,
-            sample_size=sample_size,
-            schema=schema
-        )
+        try:
+            try:
+                csv_file.save(file_path)
+            except OSError as e:
+                # /dev/shm can still fill up between the free space check and the
+                # write; retry on disk rather than failing the request
+                if e.errno != errno.ENOSPC or temp_dir != _SHM_DIR:
+                    raise
+                logger.warning(f"{_SHM_DIR} is full, saving upload to the uploads directory instead")
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                file_path = os.path.join(get_upload_dir(), file_name)
+                csv_file.stream.seek(0)
+                csv_file.save(file_path)
+            
+            # Parse the sample once and share it between schema inference and the
+            # partition analysis. If it can't be parsed (e.g. an unclosed quote or a
+            # multi-character delimiter), both read the file themselves and fall
+            # back to their own error handling (an all-string schema, no recommendations)
+            from core.schema_inferrer import read_csv_sample, analyze_column_cardinality
+            try:
+                sample_df = read_csv_sample(file_path, delimiter, has_header, quote_char, sample_size)
+            except Exception as e:
+                logger.warning(f"Could not read a CSV sample from the upload: {str(e)}")
+                sample_df = None
+            
+            # Infer schema
+            schema = infer_schema_from_csv(
+                csv_file=file_path,
+                delimiter=delimiter,
+                quote_char=quote_char,
+                has_header=has_header,
+                sample_size=sample_size,
+                sample_df=sample_df
+            )
+            
+            # Generate partition recommendations
+            partition_recommendations = analyze_column_cardinality(
+                csv_file=file_path,
+                delimiter=delimiter,
+                has_header=has_header,
+                quote_char=quote_char,
+                sample_size=sample_size,
+                schema=schema,
+                df=sample_df
+            )
+        finally:
+            # Clean up the file, also when the analysis fails, so it doesn't stay in
+            # /dev/shm until reboot
+            try:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            except OSError:
+                logger.warning(f"Could not remove temporary file: {file_path}")
         
         # Log the recommendations
         logger.info(f"Generated {len(partition_recommendations)} partition recommendations")
-        
-        # Clean up the file
-        try:
-            os.remove(file_path)
-        except OSError:
-            logger.warning(f"Could not remove temporary file: {file_path}")
             
         # Convert the PyIceberg schema to a list of columns with proper type information
         columns = []
@@ -319,8 +385,8 @@ def convert():
             max_query_size = int(request.form.get('max_query_size', 700)) * 1000  # Convert to bytes
             
             # Parse column lists
-            include_cols_list = [col.strip() for col in include_columns.split(',')] if include_columns.strip() else None
-            exclude_cols_list = [col.strip() for col in exclude_columns.split(',')] if exclude_columns.strip() else None
+            include_cols_list = parse_column_list(include_columns)
+            exclude_cols_list = parse_column_list(exclude_columns)
             
             # Validate required fields
             if not profile_name:
@@ -341,8 +407,7 @@ def convert():
             config_manager.set_last_used_profile(profile_name)
             
             # Save the file to a temporary location
-            temp_dir = os.path.join(os.getcwd(), 'uploads')
-            os.makedirs(temp_dir, exist_ok=True)
+            temp_dir = get_upload_dir()
             
             # Create a unique filename
             file_id = str(uuid.uuid4())